@@ -0,0 +1,228 @@
+"""Benchmarks the time parsing and formatting helpers commands run on every call.
+
+Usage::
+
+    python benchmarks/hot_paths.py
+    python benchmarks/hot_paths.py --save benchmarks/baseline.json
+    python benchmarks/hot_paths.py --baseline benchmarks/baseline.json
+    python benchmarks/hot_paths.py --only human
+
+Every benchmark runs over the phrases in ``corpus/reminders.json`` and
+reports calls per second (best of ``--repeat`` rounds) and the average peak
+memory a single call allocates. Against a baseline, a benchmark more than
+``--tolerance`` slower fails the run, so it can gate a deploy. Baselines are
+only comparable on the machine they were saved on.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from discord.ext import commands  # noqa: E402
+
+from utils import formats  # noqa: E402
+from utils import time as time_utils  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+NOW = datetime.datetime(2026, 1, 5, 12, 0, tzinfo=datetime.timezone.utc)
+
+Call = Callable[[Any], Any]
+
+
+class FakeMessage:
+    created_at = NOW
+
+
+class FakeBot:
+    reminder = None
+
+
+class FakeContext:
+    """Just enough of :class:`utils.context.Context` for the converters."""
+
+    bot = FakeBot()
+    message = FakeMessage()
+
+
+def ignore_bad_argument(func: Call) -> Call:
+    # invalid and past inputs are part of the corpus
+    def wrapped(item: Any) -> Any:
+        try:
+            return func(item)
+        except commands.BadArgument:
+            return None
+
+    return wrapped
+
+
+def run_async(func: Callable[[Any], Awaitable[Any]]) -> Call:
+    loop = asyncio.new_event_loop()
+
+    def wrapped(item: Any) -> Any:
+        try:
+            return loop.run_until_complete(func(item))
+        except commands.BadArgument:
+            return None
+
+    return wrapped
+
+
+def build_table(rows: int) -> formats.TabularData:
+    table = formats.TabularData()
+    table.set_columns(["#", "Count", "Total", "Worst", "Location"])
+    table.add_rows(
+        (i, i * 3, f"{i * 0.013:.3f}s", f"{i * 0.004:.3f}s", f"bot.py:{i * 7} in f")
+        for i in range(rows)
+    )
+    return table
+
+
+def benchmarks(corpus: Dict[str, List[str]]) -> Dict[str, Tuple[Call, List[Any]]]:
+    deltas = [NOW + datetime.timedelta(seconds=s) for s in (5, 4000, 90000, 4e6, 8e7)]
+    deltas += [NOW - datetime.timedelta(seconds=s) for s in (30, 7200, 3e6)]
+    tables = [build_table(rows) for rows in (1, 5, 25)]
+    uft = time_utils.UserFriendlyTime(default="…")
+    ctx = FakeContext()
+
+    return {
+        "ShortTime": (
+            ignore_bad_argument(lambda s: time_utils.ShortTime(s, now=NOW)),
+            corpus["short"],
+        ),
+        "HumanTime": (
+            ignore_bad_argument(lambda s: time_utils.HumanTime(s, now=NOW)),
+            corpus["human"],
+        ),
+        "HumanTime uncached": (
+            ignore_bad_argument(lambda s: time_utils.HumanTime(s, now=NOW)),
+            corpus["human"],
+        ),
+        "FutureTime.parse": (
+            run_async(lambda s: time_utils.FutureTime.parse(s, now=NOW)),
+            corpus["short"] + corpus["human"],
+        ),
+        "UserFriendlyTime.convert": (
+            run_async(lambda s: uft.convert(ctx, s)),  # type: ignore
+            corpus["reminders"],
+        ),
+        "human_timedelta": (
+            lambda dt: time_utils.human_timedelta(dt, source=NOW),
+            deltas,
+        ),
+        "human_timedelta brief": (
+            lambda dt: time_utils.human_timedelta(dt, source=NOW, brief=True),
+            deltas,
+        ),
+        "human_timedeltas": (
+            lambda dts: time_utils.human_timedeltas(dts, source=NOW),
+            [deltas],
+        ),
+        "format_dt": (lambda dt: formats.format_dt(dt, "R"), deltas),
+        "TabularData.render": (lambda t: t.render(), tables),
+    }
+
+
+def measure(
+    func: Call, items: List[Any], *, repeat: int, min_time: float
+) -> Tuple[float, float]:
+    """Returns calls per second and average peak KiB allocated per call."""
+    for item in items:
+        func(item)  # warm up caches and lazy imports
+
+    best = 0.0
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            for item in items:
+                func(item)
+            calls += len(items)
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, calls / elapsed)
+
+    tracemalloc.start()
+    peaks = 0
+    for item in items:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        func(item)
+        peaks += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return best, peaks / len(items) / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--only", help="only run benchmarks containing this")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown against the baseline, 0.25 is 25%%",
+    )
+    args = parser.parse_args()
+
+    with open(os.path.join(CORPUS, "reminders.json")) as fp:
+        corpus = json.load(fp)
+
+    baseline: Dict[str, Dict[str, float]] = {}
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)["results"]
+
+    results: Dict[str, Dict[str, float]] = {}
+    regressions = []
+    print(f"{'benchmark':<26} {'ops/sec':>12} {'KiB/op':>8} {'change':>8}")
+    for name, (func, items) in benchmarks(corpus).items():
+        if args.only and args.only.lower() not in name.lower():
+            continue
+
+        maxsize = time_utils.parse_cache.maxsize
+        if name.endswith("uncached"):
+            time_utils.parse_cache.maxsize = 0
+            time_utils.parse_cache.clear()
+        try:
+            ops, kib = measure(func, items, repeat=args.repeat, min_time=args.min_time)
+        finally:
+            time_utils.parse_cache.maxsize = maxsize
+
+        results[name] = {"ops_per_sec": ops, "kib_per_op": kib}
+        change = ""
+        if name in baseline:
+            ratio = ops / baseline[name]["ops_per_sec"] - 1
+            change = f"{ratio:+.1%}"
+            if ratio < -args.tolerance:
+                regressions.append(name)
+        print(f"{name:<26} {ops:>12,.0f} {kib:>8.2f} {change:>8}")
+
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump(
+                {"python": sys.version.split()[0], "results": results}, fp, indent=2
+            )
+
+    if regressions:
+        print(f"\nSlower than the baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
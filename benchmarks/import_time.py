@@ -0,0 +1,100 @@
+"""Measures how long importing the bot takes using ``python -X importtime``.
+
+Usage::
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module launcher --runs 10 --top 20
+    python benchmarks/import_time.py --save benchmarks/import_time.json
+    python benchmarks/import_time.py --baseline benchmarks/import_time.json
+
+Each run happens in a fresh interpreter so nothing is cached in
+``sys.modules``, the fastest run is reported to cut down on noise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_once(module: str) -> Dict[str, Tuple[int, int]]:
+    """Returns ``{module: (self_us, cumulative_us)}`` for a single import."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split("|", 2)
+        self_us = self_us.rpartition(":")[2]
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure(module: str, runs: int) -> Dict[str, Tuple[int, int]]:
+    best = None
+    for _ in range(runs):
+        timings = run_once(module)
+        if best is None or timings[module][1] < best[module][1]:
+            best = timings
+    return best  # type: ignore  # runs is at least 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="bot")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--save", help="write the result to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed slowdown against the baseline, 0.2 is 20%%",
+    )
+    args = parser.parse_args()
+
+    timings = measure(args.module, max(args.runs, 1))
+    total = timings[args.module][1]
+    print(f"import {args.module}: {total / 1000:.1f}ms (best of {args.runs})\n")
+
+    heaviest: List[Tuple[str, Tuple[int, int]]] = sorted(
+        ((k, v) for k, v in timings.items() if k != args.module),
+        key=lambda kv: kv[1][1],
+        reverse=True,
+    )
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for name, (self_us, cumulative_us) in heaviest[: args.top]:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {name}")
+
+    result = {"module": args.module, "total_us": total, "modules": len(timings)}
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump(result, fp, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        change = total / baseline["total_us"] - 1
+        print(
+            f"\n{change:+.1%} against the baseline of {baseline['total_us'] / 1000:.1f}ms"
+        )
+        if change > args.tolerance:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
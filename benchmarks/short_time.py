@@ -0,0 +1,86 @@
+"""Compares the ShortTime scanner with the regex and relativedelta it replaced.
+
+Usage::
+
+    python benchmarks/short_time.py
+    python benchmarks/short_time.py --number 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dateutil.relativedelta import relativedelta  # noqa: E402
+
+from utils.time import scan_duration, scan_timestamp  # noqa: E402
+
+# the previous implementation, kept here as the baseline
+COMPILED = re.compile(
+    """
+       (?:(?P<years>[0-9])(?:years?|y))?                    # e.g. 2y
+       (?:(?P<months>[0-9]{1,2})(?:months?|mon?))?          # e.g. 2months
+       (?:(?P<weeks>[0-9]{1,4})(?:weeks?|w))?               # e.g. 10w
+       (?:(?P<days>[0-9]{1,5})(?:days?|d))?                 # e.g. 14d
+       (?:(?P<hours>[0-9]{1,5})(?:hours?|hr?))?             # e.g. 12h
+       (?:(?P<minutes>[0-9]{1,5})(?:minutes?|m(?:in)?))?    # e.g. 10m
+       (?:(?P<seconds>[0-9]{1,5})(?:seconds?|s(?:ec)?))?    # e.g. 15s
+    """,
+    re.VERBOSE,
+)
+DISCORD_FMT = re.compile(r"<t:(?P<ts>[0-9]+)(?:\:?[RFfDdTt])?>")
+
+INPUTS = ["10m", "2d4h30m", "1y2mo", "3weeks", "<t:1700000000:R>", "tomorrow"]
+NOW = datetime.datetime(2024, 1, 31, 12, tzinfo=datetime.timezone.utc)
+
+
+def regex_parse(argument: str):
+    match = COMPILED.fullmatch(argument)
+    if match is None or not match.group(0):
+        match = DISCORD_FMT.fullmatch(argument)
+        if match is not None:
+            return datetime.datetime.fromtimestamp(
+                int(match.group("ts")), tz=datetime.timezone.utc
+            )
+        return None
+    data = {k: int(v) for k, v in match.groupdict(default=0).items()}
+    return NOW + relativedelta(**data)
+
+
+def scan_parse(argument: str):
+    duration = scan_duration(argument)
+    if duration is None or duration.end != len(argument):
+        stamp = scan_timestamp(argument)
+        if stamp is not None and stamp[1] == len(argument):
+            return datetime.datetime.fromtimestamp(stamp[0], tz=datetime.timezone.utc)
+        return None
+    return duration.add_to(NOW)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'input':<20} {'regex':>10} {'scanner':>10} {'speedup':>8}")
+    for argument in INPUTS:
+        assert regex_parse(argument) == scan_parse(argument), argument
+        results = []
+        for func in (regex_parse, scan_parse):
+            timer = timeit.Timer(lambda: func(argument))
+            best = min(timer.repeat(repeat=args.repeat, number=args.number))
+            results.append(best / args.number * 1e9)
+        old, new = results
+        print(f"{argument:<20} {old:>8.0f}ns {new:>8.0f}ns {old / new:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
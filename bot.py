@@ -1,17 +1,38 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import TYPE_CHECKING, AsyncIterator, Iterable, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 
 import aiohttp
 import discord
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
+from pymongo.errors import PyMongoError
 
 from utils.activities import gen_activities
+from utils.chunker import ChunkStrategy, GuildChunker
+from utils.command_sync import sync_commands
 from utils.context import Context
+from utils.interactions import InteractionWatchdog
+from utils.ipc import IPCClient
+from utils.loop_monitor import LoopMonitor
+from utils.member_cache import MemberCachePolicy, member_cache_flags
 from utils.mongo import MongoManager
+from utils.metrics import MetricsRegistry
+from utils.name_index import MemberNameIndex
+from utils.singleflight import SingleFlight
+from utils.startup import StartupTimer, load_extensions
 
 if TYPE_CHECKING:
     from cogs.email import Email
@@ -23,6 +44,20 @@ try:
     BOT_OWNER_IDS: List[int] = [int(v) for v in os.getenv("BOT_OWNER_IDS").split(",")]
 except AttributeError:
     BOT_OWNER_IDS = None
+CHUNK_STRATEGY: str = os.getenv("CHUNK_STRATEGY", ChunkStrategy.BACKGROUND).lower()
+if CHUNK_STRATEGY not in ChunkStrategy.ALL:
+    CHUNK_STRATEGY = ChunkStrategy.BACKGROUND
+CHUNK_CONCURRENCY: int = int(os.getenv("CHUNK_CONCURRENCY", "2"))
+MEMBER_CACHE_PROFILE: str = os.getenv("MEMBER_CACHE_PROFILE", "full")
+MEMBER_CACHE_LIMIT: int = int(os.getenv("MEMBER_CACHE_LIMIT", "0"))
+# Concurrent query_members requests per shard in resolve_member_ids
+RESOLVE_CONCURRENCY: int = int(os.getenv("RESOLVE_CONCURRENCY", "3"))
+# Event loop stalls longer than this many seconds are sampled
+LOOP_LAG_THRESHOLD: float = float(os.getenv("LOOP_LAG_THRESHOLD", "0.1"))
+# auto syncs app commands when their hash changed, force always syncs, off never does
+COMMAND_SYNC: str = os.getenv("COMMAND_SYNC", "auto").lower()
+# Seconds a handler gets to respond before its interaction is deferred, 0 disables
+INTERACTION_DEFER_AFTER: float = float(os.getenv("INTERACTION_DEFER_AFTER", "2.0"))
 log = logging.getLogger(__name__)
 
 description = """
@@ -32,37 +67,89 @@ A bot made for University based Discord Server's
 # major, minor, micro
 version_info = (1, 0, 0)
 
-initial_extensions = ["jishaku", "cogs.email", "cogs.verification"]
+initial_extensions = [
+    "jishaku",
+    "cogs.metrics",
+    "cogs.owner",
+    "cogs.email",
+    "cogs.verification",
+]
 
-excluded_extensions = []
+# e.g. EXCLUDED_EXTENSIONS=jishaku to skip loading it in production
+excluded_extensions = [
+    e.strip() for e in os.getenv("EXCLUDED_EXTENSIONS", "").split(",") if e.strip()
+]
+
+# extensions that have to finish loading before the given extension loads
+extension_dependencies: Dict[str, List[str]] = {
+    "cogs.verification": ["cogs.email"],
+}
 
 intents = discord.Intents.default()
 intents.members = True
 intents.message_content = True
 
+member_cache = member_cache_flags(MEMBER_CACHE_PROFILE, intents)
+
 
 class UniversityBot(commands.AutoShardedBot):
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        shard_count: int = 1,
+        shard_ids: Optional[List[int]] = None,
+        cluster_id: int = 0,
+        ipc_port: Optional[int] = None,
+    ):
         super().__init__(
             command_prefix=self.get_prefix,
             description=description,
-            chunk_guilds_at_startup=True,
+            # discord.py refuses to chunk without the joined flag
+            chunk_guilds_at_startup=CHUNK_STRATEGY == ChunkStrategy.STARTUP
+            and member_cache.joined,
             heartbeat_timeout=150.0,
             allowed_mentions=discord.AllowedMentions.none(),
             intents=intents,
+            member_cache_flags=member_cache,
             # enable_debug_events = True,
-            shard_count=1,
-            shard_ids=[0],
+            shard_count=shard_count,
+            shard_ids=shard_ids if shard_ids is not None else [0],
             status=self.change_activity.start(),
         )
         self.version_info: tuple[int, int, int] = version_info
         self.__version__: str = ".".join(str(self.version_info))
         self.maintenance_mode: bool = False
+        self.chunk_strategy: str = CHUNK_STRATEGY
+        self.chunker: GuildChunker = GuildChunker(
+            self, concurrency=CHUNK_CONCURRENCY, enabled=member_cache.joined
+        )
+        self.member_cache: MemberCachePolicy = MemberCachePolicy(
+            self, limit=MEMBER_CACHE_LIMIT
+        )
+        self.metrics: MetricsRegistry = MetricsRegistry()
+        self.startup: StartupTimer = StartupTimer()
+        self.flights: SingleFlight = SingleFlight()
+        self.loop_monitor: LoopMonitor = LoopMonitor(self, threshold=LOOP_LAG_THRESHOLD)
+        self.name_index: MemberNameIndex = MemberNameIndex(self)
+        self.interaction_watchdog: InteractionWatchdog = InteractionWatchdog(
+            self, budget=INTERACTION_DEFER_AFTER
+        )
+        self._resolve_semaphores: Dict[int, asyncio.Semaphore] = {}
+        self.cluster_id: int = cluster_id
+        self.ipc: Optional[IPCClient] = (
+            IPCClient(self, port=ipc_port) if ipc_port is not None else None
+        )
 
     async def setup_hook(self) -> None:
+        self.loop_monitor.start()
         self.session = aiohttp.ClientSession()
         self.owner_ids: List[int] = BOT_OWNER_IDS if BOT_OWNER_IDS else self.owner_ids
         self.prefixs = [",", "cs!"]
+        # paginator buttons keep working for messages sent before a restart,
+        # imported here as it pulls in menus and the database driver
+        from utils.paginator import PageButton
+
+        self.add_dynamic_items(PageButton)
         # database setup
         self.db: MongoManager = MongoManager(
             os.getenv("MONGO"), database_name="phantom"
@@ -72,17 +159,86 @@ class UniversityBot(commands.AutoShardedBot):
         except Exception:
             raise RuntimeError("Db failed to connect.")
 
-        for extension in [
-            ext for ext in initial_extensions if ext not in excluded_extensions
-        ]:
-            try:
-                await self.load_extension(extension)
-                log.info("Loaded extension %s.", extension)
-            except Exception:
-                log.exception("Failed to load extension %s.", extension)
+        # Everything below is independent, so connect and load concurrently
+        await asyncio.gather(
+            self.startup.run("database", self._setup_database()),
+            self.startup.run("ipc", self._setup_ipc()),
+            self.startup.run(
+                "extensions",
+                load_extensions(
+                    self,
+                    [e for e in initial_extensions if e not in excluded_extensions],
+                    dependencies=extension_dependencies,
+                    timer=self.startup,
+                ),
+            ),
+        )
+        # global commands are shared, so only the first cluster syncs them
+        if COMMAND_SYNC != "off" and self.cluster_id == 0:
+            await self.startup.run("command sync", self._sync_commands())
+        log.info(
+            "Setup finished in %.2fs: %s",
+            self.startup.elapsed,
+            self.startup.report(),
+        )
 
         self.tree.interaction_check = self.interaction_check
 
+    async def _setup_database(self) -> None:
+        try:
+            await self.db.ping()
+        except PyMongoError:
+            raise RuntimeError("Db failed to connect.")
+
+        if self.member_cache.enabled:
+            await self.member_cache.load_verified()
+            self.trim_member_cache.start()
+
+    async def _sync_commands(self) -> None:
+        try:
+            await sync_commands(self, force=COMMAND_SYNC == "force")
+        except PyMongoError:
+            log.exception("Could not check the command tree hash, not syncing.")
+
+    async def _setup_ipc(self) -> None:
+        if self.ipc is None:
+            return
+
+        self.ipc.add_handler("stats", self.ipc_stats)
+        self.ipc.add_handler("maintenance", self.ipc_maintenance)
+        self.ipc.add_handler("reload", self.ipc_reload)
+        try:
+            await self.ipc.connect()
+        except OSError:
+            log.warning("Cluster %s could not connect to IPC.", self.cluster_id)
+
+    async def ipc_stats(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "cluster": self.cluster_id,
+            "shards": list(self.shards),
+            "guilds": len(self.guilds),
+            "users": len(self.users),
+            "latency": self.latency,
+        }
+
+    async def ipc_maintenance(self, data: Dict[str, Any]) -> bool:
+        self.maintenance_mode = data["enabled"]
+        return self.maintenance_mode
+
+    async def ipc_reload(self, data: Dict[str, Any]) -> bool:
+        try:
+            await self.reload_extension(data["extension"])
+        except commands.ExtensionError:
+            log.exception("Failed to reload extension %s.", data["extension"])
+            return False
+        return True
+
+    async def cluster_stats(self) -> List[Dict[str, Any]]:
+        """Returns the stats of every cluster, including this one."""
+        if self.ipc is None:
+            return [await self.ipc_stats({})]
+        return sorted(await self.ipc.request("stats"), key=lambda s: s["cluster"])
+
     @property
     def owners(self) -> List[discord.User]:
         users = []
@@ -102,10 +258,23 @@ class UniversityBot(commands.AutoShardedBot):
     async def before_change_activity(self):
         await self.wait_until_ready()
 
+    @tasks.loop(seconds=60)
+    async def trim_member_cache(self):
+        """Keeps the member cache within MEMBER_CACHE_LIMIT"""
+
+        self.member_cache.trim()
+
+    @trim_member_cache.before_loop
+    async def before_trim_member_cache(self):
+        await self.wait_until_ready()
+
     async def query_member_named(
         self, guild: discord.Guild, argument: str, *, cache: bool = False
     ) -> Optional[discord.Member]:
-        """Queries a member by their name, name + discrim, or nickname.
+        """Queries a member by their name, name + discrim, global name or nickname.
+
+        The local name index is checked first, the gateway is only queried
+        on a miss.
 
         Parameters
         ------------
@@ -121,19 +290,24 @@ class UniversityBot(commands.AutoShardedBot):
         Optional[Member]
             The member matching the query or None if not found.
         """
+        discriminator = None
         if len(argument) > 5 and argument[-5] == "#":
-            username, _, discriminator = argument.rpartition(
-                "#"
-            )  # TODO: change due to removal of discriminator
-            members = await guild.query_members(username, limit=100, cache=cache)
-            return discord.utils.get(
-                members, name=username, discriminator=discriminator
-            )
-        else:
-            members = await guild.query_members(argument, limit=100, cache=cache)
-            return discord.utils.find(
-                lambda m: m.name == argument or m.nick == argument, members
-            )
+            # only bots and unmigrated users still have discriminators
+            argument, _, discriminator = argument.rpartition("#")
+
+        def matches(member: discord.Member) -> bool:
+            if discriminator is not None and member.discriminator != discriminator:
+                return False
+            return argument in (member.name, member.global_name, member.nick)
+
+        member = discord.utils.find(matches, self.name_index.exact(guild, argument))
+        if member is not None:
+            return member
+
+        members = await guild.query_members(argument, limit=100, cache=cache)
+        if cache:
+            self.name_index.add_many(guild, members)
+        return discord.utils.find(matches, members)
 
     async def get_or_fetch_guild(self, guild_id: int) -> Optional[discord.Guild]:
         """Looks up the given guild in cache or fetches if not found.
@@ -152,11 +326,41 @@ class UniversityBot(commands.AutoShardedBot):
         guild = self.get_guild(guild_id)
         if not guild:
             try:
-                guild = await self.fetch_guild(guild_id)
+                guild = await self.flights.do(
+                    ("guild", guild_id), lambda: self.fetch_guild(guild_id)
+                )
             except (discord.Forbidden, discord.HTTPException):
                 return None
         return guild
 
+    async def get_or_fetch_channel(
+        self, channel_id: int
+    ) -> Optional[
+        Union[discord.abc.GuildChannel, discord.abc.PrivateChannel, discord.Thread]
+    ]:
+        """Looks up the given channel in cache or fetches if not found.
+
+        Parameters
+        -----------
+        channel_id: int
+            The id of the channel to look for.
+
+        Returns
+        ---------
+        Optional[Union[GuildChannel, PrivateChannel, Thread]]
+            The channel or None if not found.
+        """
+
+        channel = self.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await self.flights.do(
+                    ("channel", channel_id), lambda: self.fetch_channel(channel_id)
+                )
+            except discord.HTTPException:
+                return None
+        return channel
+
     async def get_or_fetch_member(
         self, guild: discord.Guild, member_id: int
     ) -> Optional[discord.Member]:
@@ -177,21 +381,29 @@ class UniversityBot(commands.AutoShardedBot):
 
         member = guild.get_member(member_id)
         if member is not None:
+            self.member_cache.touch(member)
             return member
 
+        self.chunker.request(guild)
+        try:
+            member = await self.flights.do(
+                ("member", guild.id, member_id),
+                lambda: self._fetch_member(guild, member_id),
+            )
+        except discord.HTTPException:
+            return None
+        self.member_cache.touch(member)
+        return member
+
+    async def _fetch_member(
+        self, guild: discord.Guild, member_id: int
+    ) -> Optional[discord.Member]:
         shard: discord.ShardInfo = self.get_shard(guild.shard_id)  # type: ignore  # will never be None
         if shard.is_ws_ratelimited():
-            try:
-                member = await guild.fetch_member(member_id)
-            except discord.HTTPException:
-                return None
-            else:
-                return member
+            return await guild.fetch_member(member_id)
 
         members = await guild.query_members(limit=1, user_ids=[member_id], cache=True)
-        if not members:
-            return None
-        return members[0]
+        return members[0] if members else None
 
     async def resolve_member_ids(
         self, guild: discord.Guild, member_ids: Iterable[int]
@@ -222,47 +434,90 @@ class UniversityBot(commands.AutoShardedBot):
             member = guild.get_member(member_id)
             if member is not None:
                 yield member
-            else:
+            elif not self.flights.is_missing(("member", guild.id, member_id)):
                 needs_resolution.append(member_id)
 
+        if needs_resolution:
+            self.chunker.request(guild)
+
         total_need_resolution = len(needs_resolution)
         if total_need_resolution == 1:
-            shard: discord.ShardInfo = self.get_shard(guild.shard_id)  # type: ignore  # will never be None
-            if shard.is_ws_ratelimited():
-                try:
-                    member = await guild.fetch_member(needs_resolution[0])
-                except discord.HTTPException:
-                    pass
-                else:
-                    yield member
-            else:
-                members = await guild.query_members(
-                    limit=1, user_ids=needs_resolution, cache=True
-                )
-                if members:
-                    yield members[0]
-        elif total_need_resolution <= 100:
-            # Only a single resolution call needed here
-            resolved = await guild.query_members(
-                limit=100, user_ids=needs_resolution, cache=True
-            )
-            for member in resolved:
+            member = await self.get_or_fetch_member(guild, needs_resolution[0])
+            if member is not None:
                 yield member
-        else:
-            # We need to chunk these in bits of 100...
-            for index in range(0, total_need_resolution, 100):
-                to_resolve = needs_resolution[index : index + 100]
-                members = await guild.query_members(
-                    limit=100, user_ids=to_resolve, cache=True
-                )
+            return
+
+        # We need to chunk these in bits of 100 and run a few chunks at once,
+        # yielding each chunk as soon as it arrives.
+        tasks = [
+            asyncio.create_task(
+                self._resolve_member_chunk(guild, needs_resolution[index : index + 100])
+            )
+            for index in range(0, total_need_resolution, 100)
+        ]
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    members = await future
+                except asyncio.TimeoutError:
+                    continue
                 for member in members:
                     yield member
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _resolve_member_chunk(
+        self, guild: discord.Guild, member_ids: List[int]
+    ) -> List[discord.Member]:
+        semaphore = self._resolve_semaphores.get(guild.shard_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+            self._resolve_semaphores[guild.shard_id] = semaphore
+
+        async with semaphore:
+            members = await guild.query_members(
+                limit=100, user_ids=member_ids, cache=True
+            )
+
+        found = {m.id for m in members}
+        for member_id in member_ids:
+            if member_id not in found:
+                self.flights.mark_missing(("member", guild.id, member_id))
+        return members
 
     async def on_ready(self) -> None:
         if not hasattr(self, "starttime"):
             self.starttime = discord.utils.utcnow()
+            log.info("Ready %.2fs after startup.", self.startup.elapsed)
 
         log.info("Ready: %s (ID: %s)", self.user, self.user.id)
+        if self.chunk_strategy == ChunkStrategy.BACKGROUND:
+            self.chunker.start_background()
+
+    async def on_member_join(self, member: discord.Member) -> None:
+        self.flights.forget(("member", member.guild.id, member.id))
+        self.name_index.add(member)
+
+    async def on_member_remove(self, member: discord.Member) -> None:
+        self.name_index.remove(member.guild.id, member.id)
+
+    async def on_member_update(
+        self, before: discord.Member, after: discord.Member
+    ) -> None:
+        if before.nick != after.nick:
+            self.name_index.add(after)
+
+    async def on_user_update(self, before: discord.User, after: discord.User) -> None:
+        if before.name != after.name or before.global_name != after.global_name:
+            self.name_index.update_user(after)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self.name_index.invalidate(guild.id)
+
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        if self.chunk_strategy == ChunkStrategy.BACKGROUND:
+            self.chunker.request(guild)
 
     async def get_context(
         self, origin: Union[discord.Interaction, discord.Message], /, *, cls=Context
@@ -310,6 +565,7 @@ class UniversityBot(commands.AutoShardedBot):
             )
             return False
 
+        self.member_cache.touch(interaction.user)
         if interaction.user.id in self.owner_ids:
             return True
 
@@ -332,9 +588,13 @@ class UniversityBot(commands.AutoShardedBot):
             else member.default_avatar.url
         )
 
+    async def on_interaction(self, interaction: discord.Interaction) -> None:
+        self.interaction_watchdog.watch(interaction)
+
     async def on_message(self, message: discord.Message) -> None:
         if message.author.bot:
             return
+        self.member_cache.touch(message.author)
         await self.process_commands(message)
 
     async def get_prefix(self, message: discord.Message) -> str:
@@ -342,6 +602,10 @@ class UniversityBot(commands.AutoShardedBot):
 
     async def close(self) -> None:
         log.info("Shutdown initiated, cleaning up...")
+        self.chunker.cancel()
+        self.loop_monitor.stop()
+        if self.ipc is not None:
+            await self.ipc.close()
         await self.session.close()
         return await super().close()
 
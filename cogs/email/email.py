@@ -22,6 +22,9 @@ class Email(commands.Cog):
         self.__sender_email: str = os.getenv("EMAIL_ADDRESS")
         self.__sender_password: str = os.getenv("EMAIL_APP_PASSWORD")
         self.__smtp_client: Optional[aiosmtplib.SMTP] = None
+        self.emails_total = bot.metrics.counter(
+            "emails_total", "OTP emails by delivery status."
+        )
 
     async def cog_load(self) -> None:
         self.__smtp_client = aiosmtplib.SMTP(
@@ -41,6 +44,11 @@ class Email(commands.Cog):
         body: str,
     ) -> bool:
         """Sends the OTP code to the provided email address using Gmail's SMTP server."""
+        sent = await self._send_email(email, subject, body)
+        self.emails_total.inc(status="sent" if sent else "failed")
+        return sent
+
+    async def _send_email(self, email: str, subject: str, body: str) -> bool:
         if not self.__smtp_client:
             return False
 
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from dotenv import load_dotenv
+
+from utils import time as time_utils
+from utils.metrics import MetricsServer
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+    from utils.context import Context
+
+load_dotenv()
+log = logging.getLogger(__name__)
+
+# 0 disables the HTTP endpoint, clusters listen on METRICS_PORT + cluster id
+METRICS_PORT: int = int(os.getenv("METRICS_PORT", "0"))
+
+
+class Metrics(commands.Cog):
+    """Exposes runtime metrics of the bot for Prometheus to scrape."""
+
+    def __init__(self, bot: UniversityBot):
+        self.bot: UniversityBot = bot
+        registry = bot.metrics
+        self.commands_total = registry.counter(
+            "commands_total", "Prefix and hybrid command invocations."
+        )
+        self.command_duration = registry.histogram(
+            "command_duration_seconds", "Time taken to run a prefix command."
+        )
+        self.interaction_duration = registry.histogram(
+            "interaction_duration_seconds",
+            "Time from an app command interaction being created to its handler finishing.",
+        )
+        self.gateway_events = registry.counter(
+            "gateway_events_total", "Gateway events received by type."
+        )
+        self.cache_size = registry.gauge("cache_size", "Number of cached objects.")
+        self.latency = registry.gauge("gateway_latency_seconds", "Heartbeat latency.")
+        self.parse_cache_lookups = registry.counter(
+            "time_parse_cache_lookups_total",
+            "Natural language time parse cache lookups by result.",
+        )
+        self._parse_cache_seen: Dict[str, int] = {}
+        self.__server: Optional[MetricsServer] = None
+
+    async def cog_load(self) -> None:
+        self.bot.metrics.add_collector(self.collect)
+        if METRICS_PORT:
+            self.__server = MetricsServer(
+                self.bot.metrics, port=METRICS_PORT + self.bot.cluster_id
+            )
+            await self.__server.start()
+
+    async def cog_unload(self) -> None:
+        self.bot.metrics.remove_collector(self.collect)
+        if self.__server is not None:
+            await self.__server.close()
+
+    async def collect(self) -> None:
+        bot = self.bot
+        self.cache_size.set(len(bot.guilds), cache="guilds")
+        self.cache_size.set(len(bot.users), cache="users")
+        self.cache_size.set(bot.member_cache.size(), cache="members")
+        self.cache_size.set(len(bot.cached_messages), cache="messages")
+        self.cache_size.set(len(bot.name_index), cache="member_names")
+        self.cache_size.set(bot.flights.negative_size, cache="negative_lookups")
+        for shard_id, shard in bot.shards.items():
+            self.latency.set(shard.latency, shard=shard_id)
+
+        # the cache lives outside the bot, so mirror its running totals
+        parse_cache = time_utils.parse_cache
+        self.cache_size.set(len(parse_cache), cache="time_parses")
+        for result, total in (("hit", parse_cache.hits), ("miss", parse_cache.misses)):
+            seen = self._parse_cache_seen.get(result, 0)
+            if total < seen:
+                # the totals went back to zero when the cache was cleared
+                seen = 0
+            if total > seen:
+                self.parse_cache_lookups.inc(total - seen, result=result)
+            self._parse_cache_seen[result] = total
+
+    @commands.Cog.listener()
+    async def on_command(self, ctx: Context) -> None:
+        ctx.metrics_started = time.perf_counter()
+
+    def _record_command(self, ctx: Context, status: str) -> None:
+        name = ctx.command.qualified_name if ctx.command else "unknown"
+        self.commands_total.inc(command=name, status=status)
+        started = getattr(ctx, "metrics_started", None)
+        if started is not None:
+            self.command_duration.observe(time.perf_counter() - started, command=name)
+
+    @commands.Cog.listener()
+    async def on_command_completion(self, ctx: Context) -> None:
+        self._record_command(ctx, "success")
+
+    @commands.Cog.listener()
+    async def on_command_error(
+        self, ctx: Context, error: commands.CommandError
+    ) -> None:
+        if ctx.command is not None:
+            self._record_command(ctx, "error")
+
+    @commands.Cog.listener()
+    async def on_app_command_completion(
+        self,
+        interaction: discord.Interaction,
+        command: Union[app_commands.Command, app_commands.ContextMenu],
+    ) -> None:
+        elapsed = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        self.interaction_duration.observe(elapsed, command=command.qualified_name)
+
+    @commands.Cog.listener()
+    async def on_socket_event_type(self, event_type: str) -> None:
+        self.gateway_events.inc(type=event_type)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .owner import Owner
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+
+__all__ = ["Owner"]
+
+
+async def setup(bot: UniversityBot):
+    await bot.add_cog(Owner(bot))
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import io
+from typing import TYPE_CHECKING
+
+import discord
+from discord.ext import commands
+
+from utils import formats, profiler
+from utils.command_sync import sync_commands
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+    from utils.context import Context
+
+
+class Owner(commands.Cog):
+    """Diagnostics for the bot owners."""
+
+    def __init__(self, bot: UniversityBot):
+        self.bot: UniversityBot = bot
+        self._profiling = asyncio.Lock()
+
+    async def cog_check(self, ctx: Context) -> bool:
+        return await self.bot.is_owner(ctx.author)
+
+    @commands.group(name="loop", invoke_without_command=True)
+    async def loop(self, ctx: Context):
+        """Shows the current event loop lag."""
+        monitor = self.bot.loop_monitor
+        await ctx.send(
+            f"Current lag: {monitor.current_lag * 1000:.1f}ms\n"
+            f"Worst lag: {monitor.max_lag * 1000:.1f}ms\n"
+            f"Stall locations: {len(monitor.stalls)}"
+        )
+
+    @loop.command(name="stalls")
+    async def loop_stalls(self, ctx: Context, limit: int = 5):
+        """Dumps the stack of the worst event loop stalls."""
+        records = self.bot.loop_monitor.worst(limit)
+        if not records:
+            return await ctx.send("No event loop stalls recorded.")
+
+        table = formats.TabularData()
+        table.set_columns(["#", "Count", "Total", "Worst", "Location"])
+        table.add_rows(
+            (
+                index,
+                record.count,
+                f"{record.total:.3f}s",
+                f"{record.worst:.3f}s",
+                record.location,
+            )
+            for index, record in enumerate(records, start=1)
+        )
+
+        output = [table.render()]
+        for index, record in enumerate(records, start=1):
+            output.append(f"\n#{index}\n{record.format()}")
+        await ctx.safe_send("```\n" + "\n".join(output) + "\n```")
+
+    @loop.command(name="reset")
+    async def loop_reset(self, ctx: Context):
+        """Clears the recorded stalls and worst lag."""
+        self.bot.loop_monitor.reset()
+        await ctx.send("Cleared the event loop stall records.")
+
+    @commands.group(name="profile", invoke_without_command=True)
+    async def profile(
+        self, ctx: Context, seconds: commands.Range[float, 1, 120] = 10.0
+    ):
+        """Samples the event loop's stack for a number of seconds.
+
+        Replies with the hottest functions and a collapsed stack file that
+        can be fed to flamegraph tools.
+        """
+        if self._profiling.locked():
+            return await ctx.send("A profile is already running.")
+
+        async with self._profiling:
+            await ctx.send(f"Sampling for {seconds:g} seconds...")
+            result = await profiler.sample_loop(seconds)
+
+        table = formats.TabularData()
+        table.set_columns(["Function", "Self", "Total"])
+        table.add_rows(
+            (name, f"{own / result.total:.1%}", f"{total / result.total:.1%}")
+            for name, own, total in result.top()
+        )
+        fp = io.BytesIO(result.collapsed().encode())
+        await ctx.send(
+            f"```\n{table.render()}\n```"[:2000],
+            file=discord.File(fp, filename="profile.collapsed"),
+        )
+
+    @profile.command(name="calls")
+    async def profile_calls(
+        self, ctx: Context, seconds: commands.Range[float, 1, 120] = 10.0
+    ):
+        """Runs cProfile over the event loop for a number of seconds."""
+        if self._profiling.locked():
+            return await ctx.send("A profile is already running.")
+
+        async with self._profiling:
+            await ctx.send(f"Profiling for {seconds:g} seconds...")
+            output = await profiler.profile_calls(seconds)
+
+        await ctx.safe_send(f"```\n{output}\n```")
+
+    @profile.command(name="memory")
+    async def profile_memory(
+        self, ctx: Context, seconds: commands.Range[float, 1, 300] = 30.0
+    ):
+        """Shows which lines allocated the most memory over a number of seconds."""
+        if self._profiling.locked():
+            return await ctx.send("A profile is already running.")
+
+        async with self._profiling:
+            await ctx.send(f"Tracing allocations for {seconds:g} seconds...")
+            output = await profiler.memory_diff(seconds)
+
+        await ctx.safe_send(f"```\n{output or 'No allocation growth.'}\n```")
+
+    @commands.command(name="sync")
+    async def sync(self, ctx: Context, force: bool = False):
+        """Syncs the app commands whose hash changed since the last sync."""
+        synced = await sync_commands(self.bot, force=force)
+        if not synced:
+            return await ctx.send("The command tree is already up to date.")
+        scopes = formats.human_join(synced, final="and")
+        await ctx.send(f"Synced the command tree for {scopes}.")
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import os
+import re
+import socket
 import textwrap
-from typing import TYPE_CHECKING, Any, Optional
+import zoneinfo
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 import alaric
 import discord
@@ -12,6 +17,12 @@ from discord.ext import commands
 from typing_extensions import Annotated
 
 from utils import formats, time
+from utils.interactions import respond
+from utils.paginator import (
+    CursorPageSource,
+    PersistentPages,
+    persistent_page_source,
+)
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -21,39 +32,74 @@ if TYPE_CHECKING:
 
 from pymongo.errors import PyMongoError
 
+# How long a worker holds a timer while dispatching it
+LEASE_SECONDS = 30
+# Timers owned by another cluster are taken over once they are this late
+TAKEOVER_GRACE = datetime.timedelta(seconds=60)
+# How often an idle dispatcher checks for timers created elsewhere
+POLL_SECONDS = 60
+# How many users' timezones are kept in memory
+TIMEZONE_CACHE_SIZE = 10_000
+# Autocomplete for /reminder set only parses once typing pauses for this long
+AUTOCOMPLETE_DEBOUNCE = 0.3
+# and gives up on parsing after this long, Discord allows 3 seconds
+AUTOCOMPLETE_BUDGET = 1.0
+# What a delivered reminder says, snoozing reads the reminder back from it
+REMINDER_CONTENT = re.compile(r"<@[0-9]+>, <t:-?[0-9]+:R>: (?P<message>.*)", re.DOTALL)
+SUGGESTED_TIMES = (
+    "in 10 minutes",
+    "in 1 hour",
+    "tonight",
+    "tomorrow",
+    "tomorrow at 9am",
+    "next monday",
+    "in 1 week",
+)
+
+
+def reminder_jump_url(guild_id: Optional[int], channel_id: int, message_id: int) -> str:
+    guild = guild_id if guild_id is not None else "@me"
+    return f"https://discord.com/channels/{guild}/{channel_id}/{message_id}"
+
 
 class SnoozeModal(discord.ui.Modal, title="Snooze"):
     duration = discord.ui.TextInput(
         label="Duration", placeholder="10 minutes", default="10 minutes", min_length=2
     )
 
-    def __init__(self, parent: ReminderView, cog: Reminder, timer: Timer) -> None:
+    def __init__(self, cog: Reminder, kwargs: Dict[str, Any], *, url: str) -> None:
         super().__init__()
-        self.parent: ReminderView = parent
-        self.timer: Timer = timer
         self.cog: Reminder = cog
+        self.kwargs: Dict[str, Any] = kwargs
+        self.url: str = url
 
     async def on_submit(self, interaction: discord.Interaction) -> None:
         try:
-            when = time.FutureTime(str(self.duration)).dt
+            when = (await time.FutureTime.parse(str(self.duration))).dt
         except Exception:
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 'Duration could not be parsed, sorry. Try something like "5 minutes" or "1 hour"',
                 ephemeral=True,
             )
             return
 
-        self.parent.snooze.disabled = True
-        await interaction.response.edit_message(view=self.parent)
+        kwargs = self.kwargs
+        author_id, message = kwargs["author"], kwargs["message"]
+        view = ReminderView(
+            url=self.url,
+            author_id=author_id,
+            message_id=kwargs["message_id"],
+            snoozed=True,
+        )
+        if interaction.response.is_done():
+            await interaction.message.edit(view=view)
+        else:
+            await interaction.response.edit_message(view=view)
 
         refreshed = await self.cog.create_timer(
-            when,
-            self.timer.event,
-            **self.timer.kwargs,
-            created=interaction.created_at,
+            when, "reminder", **kwargs, created=interaction.created_at
         )
-        kwargs = self.timer.kwargs
-        author_id, _, message = kwargs["author"], kwargs["channel"], kwargs["message"]
         delta = time.human_timedelta(when, source=refreshed.created_at)
         await interaction.followup.send(
             f"Alright <@{author_id}>, I've snoozed your reminder for {delta}: {message}",
@@ -61,42 +107,123 @@ class SnoozeModal(discord.ui.Modal, title="Snooze"):
         )
 
 
-class SnoozeButton(discord.ui.Button["ReminderView"]):
-    def __init__(self, cog: Reminder, timer: Timer) -> None:
-        super().__init__(label="Snooze", style=discord.ButtonStyle.blurple)
-        self.timer: Timer = timer
-        self.cog: Reminder = cog
+class SnoozeButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"reminder:snooze:(?P<author_id>[0-9]+):(?P<message_id>[0-9]+)",
+):
+    """Snoozes a delivered reminder.
+
+    The timer is gone once the reminder is delivered, so the reminder is
+    rebuilt from the custom ID and the content of the delivered message.
+    """
+
+    def __init__(self, author_id: int, message_id: int) -> None:
+        super().__init__(
+            discord.ui.Button(
+                label="Snooze",
+                style=discord.ButtonStyle.blurple,
+                custom_id=f"reminder:snooze:{author_id}:{message_id}",
+            )
+        )
+        self.author_id: int = author_id
+        self.message_id: int = message_id
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: discord.ui.Button,
+        match: re.Match[str],
+        /,
+    ) -> Self:
+        return cls(int(match["author_id"]), int(match["message_id"]))
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message(
+                "This snooze button is not for you, sorry!", ephemeral=True
+            )
+            return False
+        return True
 
     async def callback(self, interaction: discord.Interaction) -> Any:
-        assert self.view is not None
-        await interaction.response.send_modal(
-            SnoozeModal(self.view, self.cog, self.timer)
+        cog: Optional[Reminder] = interaction.client.get_cog("Reminder")  # type: ignore
+        content = interaction.message.content if interaction.message else ""
+        match = REMINDER_CONTENT.fullmatch(content)
+        if cog is None or match is None:
+            await respond(
+                interaction,
+                "This reminder can no longer be snoozed, sorry!",
+                ephemeral=True,
+            )
+            return
+        if interaction.response.is_done():
+            # a modal can only be the first response
+            await interaction.followup.send(
+                "That took too long, press Snooze again.", ephemeral=True
+            )
+            return
+
+        kwargs = {
+            "author": self.author_id,
+            "channel": interaction.channel_id,
+            "message": match["message"],
+            "message_id": self.message_id,
+        }
+        url = reminder_jump_url(
+            interaction.guild_id, interaction.channel_id, self.message_id  # type: ignore
         )
+        await interaction.response.send_modal(SnoozeModal(cog, kwargs, url=url))
 
 
 class ReminderView(discord.ui.View):
-    message: discord.Message
+    """The buttons of a delivered reminder.
+
+    Only holds a link and a :class:`SnoozeButton`, so it is stopped right
+    away and nothing is kept in memory once it is sent.
+    """
 
     def __init__(
-        self, *, url: str, timer: Timer, cog: Reminder, author_id: int
+        self, *, url: str, author_id: int, message_id: int, snoozed: bool = False
     ) -> None:
-        super().__init__(timeout=300)
-        self.author_id: int = author_id
-        self.snooze = SnoozeButton(cog, timer)
+        super().__init__(timeout=None)
+        snooze = SnoozeButton(author_id, message_id)
+        snooze.item.disabled = snoozed
         self.add_item(discord.ui.Button(url=url, label="Go to original message"))
-        self.add_item(self.snooze)
+        self.add_item(snooze)
+        self.stop()
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user.id != self.author_id:
-            await interaction.response.send_message(
-                "This snooze button is not for you, sorry!", ephemeral=True
+
+@persistent_page_source("reminders")
+class ReminderPageSource(CursorPageSource):
+    def __init__(self, bot: UniversityBot, author_id: int) -> None:
+        super().__init__(
+            bot.db.reminders,
+            {"event": "reminder", "kwargs.author": author_id},
+            key="expires",
+        )
+
+    async def format_page(
+        self, menu: PersistentPages, entries: List[Dict[str, Any]]
+    ) -> discord.Embed:
+        e = discord.Embed(colour=discord.Colour.blurple(), title="Reminders")
+        expires = [record["expires"] for record in entries]
+        # the exact time stays correct, the span is as of this render
+        deltas = time.human_timedeltas(expires, accuracy=2, brief=True)
+        for record, when, delta in zip(entries, expires, deltas):
+            shorten = textwrap.shorten(record["kwargs"]["message"], width=512)
+            e.add_field(
+                name=f"{record['_id']}: {time.format_dt(when, 'f')} ({delta})",
+                value=shorten,
+                inline=False,
             )
-            return False
-        return True
 
-    async def on_timeout(self) -> None:
-        self.snooze.disabled = True
-        await self.message.edit(view=self)
+        footer = f'{self.total} reminder{"s" if self.total != 1 else ""}'
+        maximum = self.get_max_pages()
+        if maximum > 1:
+            footer = f"Page {menu.current_page + 1}/{maximum} ({footer})"
+        e.set_footer(text=footer)
+        return e
 
 
 class Timer:
@@ -162,14 +289,47 @@ class Reminder(commands.Cog):
         self.bot: UniversityBot = bot
         self._have_data = asyncio.Event()
         self._current_timer: Optional[Timer] = None
+        self.worker_id: str = f"{socket.gethostname()}:{os.getpid()}"
+        if bot.ipc is not None:
+            bot.ipc.add_handler("reminder_wake", self.ipc_wake)
+        self.timers_pending = bot.metrics.gauge(
+            "timers_pending", "Timers waiting in the database."
+        )
+        self.timer_lag = bot.metrics.histogram(
+            "timer_lag_seconds", "How late timers are dispatched after expiring."
+        )
+        bot.metrics.add_collector(self.collect_metrics)
+        self._timezones: OrderedDict[int, datetime.tzinfo] = OrderedDict()
+        # user id -> their latest autocomplete interaction
+        self._autocomplete_latest: Dict[int, int] = {}
+        self.autocomplete_total = bot.metrics.counter(
+            "reminder_autocomplete_total",
+            "Reminder time autocomplete requests by outcome.",
+        )
         self._task = bot.loop.create_task(self.dispatch_timers())
 
     @property
     def display_emoji(self) -> discord.PartialEmoji:
         return discord.PartialEmoji(name="elem_clock", id=1077266893213274182)
 
+    async def cog_load(self) -> None:
+        self.bot.add_dynamic_items(SnoozeButton)
+        # people with pending reminders are the likeliest to use time commands
+        try:
+            authors = await self.bot.db.reminders.raw_collection.distinct(
+                "kwargs.author", {"event": "reminder"}
+            )
+            await self.preload_timezones(authors)
+        except PyMongoError:
+            pass
+
     def cog_unload(self) -> None:
+        self.bot.remove_dynamic_items(SnoozeButton)
         self._task.cancel()
+        self.bot.metrics.remove_collector(self.collect_metrics)
+
+    async def collect_metrics(self) -> None:
+        self.timers_pending.set(await self.bot.db.reminders.count({}))
 
     async def cog_command_error(self, ctx: Context, error: commands.CommandError):
         if isinstance(error, commands.BadArgument):
@@ -179,15 +339,96 @@ class Reminder(commands.Cog):
                 f"You called the {ctx.command.name} command with too many arguments."
             )
 
+    def _cache_tzinfo(self, user_id: int, tzinfo: datetime.tzinfo) -> None:
+        self._timezones[user_id] = tzinfo
+        self._timezones.move_to_end(user_id)
+        if len(self._timezones) > TIMEZONE_CACHE_SIZE:
+            self._timezones.popitem(last=False)
+
+    @staticmethod
+    def _to_tzinfo(record: Optional[Dict[str, Any]]) -> datetime.tzinfo:
+        if record is None:
+            return datetime.timezone.utc
+        try:
+            return zoneinfo.ZoneInfo(record["timezone"])
+        except (KeyError, ValueError, zoneinfo.ZoneInfoNotFoundError):
+            return datetime.timezone.utc
+
+    async def _fetch_tzinfo(self, user_id: int) -> datetime.tzinfo:
+        record = await self.bot.db.timezones.find({"_id": user_id})
+        tzinfo = self._to_tzinfo(record)
+        self._cache_tzinfo(user_id, tzinfo)
+        return tzinfo
+
+    async def get_tzinfo(self, user_id: int) -> datetime.tzinfo:
+        """Returns the timezone the user set, UTC if they did not set one."""
+        tzinfo = self._timezones.get(user_id)
+        if tzinfo is not None:
+            self._timezones.move_to_end(user_id)
+            return tzinfo
+        tzinfo = await self.bot.flights.do(
+            ("timezone", user_id), lambda: self._fetch_tzinfo(user_id)
+        )
+        return tzinfo or datetime.timezone.utc
+
+    async def preload_timezones(self, user_ids: Iterable[int]) -> None:
+        """Loads the timezones of the given users that are not cached in one query."""
+        missing = [u for u in set(user_ids) if u not in self._timezones]
+        if not missing:
+            return
+
+        found: Dict[int, Dict[str, Any]] = {}
+        for start in range(0, len(missing), 1000):
+            cursor = self.bot.db.timezones.raw_collection.find(
+                {"_id": {"$in": missing[start : start + 1000]}}
+            )
+            async for record in cursor:
+                found[record["_id"]] = record
+
+        for user_id in missing[:TIMEZONE_CACHE_SIZE]:
+            self._cache_tzinfo(user_id, self._to_tzinfo(found.get(user_id)))
+
+    @property
+    def shard_ids(self) -> List[int]:
+        return self.bot.shard_ids or [0]
+
+    def owns_shard(self, shard_id: int) -> bool:
+        return shard_id in self.shard_ids
+
+    def shard_for_channel(self, channel_id: Optional[int]) -> int:
+        """Returns the shard that will deliver a timer for the channel.
+
+        DMs and unknown channels belong to shard 0.
+        """
+        channel = self.bot.get_channel(channel_id) if channel_id else None
+        guild = getattr(channel, "guild", None)
+        return guild.shard_id if guild is not None else 0
+
+    def _ownership_filter(self, now: datetime.datetime) -> Dict[str, Any]:
+        # Timers are partitioned by shard so each cluster mostly delivers to
+        # channels it already has cached. Late timers are taken over by anyone
+        # so a dead cluster does not swallow reminders.
+        owned: List[Dict[str, Any]] = [
+            {"shard": {"$in": self.shard_ids}},
+            {"expires": {"$lt": now - TAKEOVER_GRACE}},
+        ]
+        if self.owns_shard(0):
+            owned.append({"shard": {"$exists": False}})
+        unleased = [
+            {"lease_until": {"$exists": False}},
+            {"lease_until": {"$lt": now}},
+        ]
+        return {"$and": [{"$or": owned}, {"$or": unleased}]}
+
     async def get_active_timer(self, *, days: int = 7) -> Optional[Timer]:
+        now = discord.utils.utcnow()
         cur = (
             self.bot.db.reminders.create_cursor()
             .set_limit(1)
             .set_filter(
                 {
-                    "expires": {
-                        "$lt": discord.utils.utcnow() + datetime.timedelta(days=days)
-                    }
+                    "expires": {"$lt": now + datetime.timedelta(days=days)},
+                    **self._ownership_filter(now),
                 }
             )
             .set_sort(("expires", alaric.Ascending))
@@ -195,7 +436,7 @@ class Reminder(commands.Cog):
         record = [c async for c in cur]
         return Timer(record=record[0]) if record else None
 
-    async def wait_for_active_timers(self, *, days: int = 7) -> Timer:
+    async def wait_for_active_timers(self, *, days: int = 7) -> Optional[Timer]:
         timer = await self.get_active_timer(days=days)
         if timer is not None:
             self._have_data.set()
@@ -203,13 +444,43 @@ class Reminder(commands.Cog):
 
         self._have_data.clear()
         self._current_timer = None
-        await self._have_data.wait()
+        try:
+            # Timers created by other clusters, or ones we might have to take
+            # over, don't set the event so we have to poll for them as well.
+            await asyncio.wait_for(self._have_data.wait(), timeout=POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+        return await self.get_active_timer(days=days)
 
-        # At this point we always have data
-        return await self.get_active_timer(days=days)  # type: ignore
+    async def claim_timer(self, timer: Timer) -> bool:
+        """Leases the timer to this worker.
+
+        Returns ``False`` if another worker already holds it, in which case the
+        timer must not be dispatched here.
+        """
+        now = discord.utils.utcnow()
+        record = await self.bot.db.reminders.raw_collection.find_one_and_update(
+            {
+                "_id": timer.id,
+                "$or": [
+                    {"lease_until": {"$exists": False}},
+                    {"lease_until": {"$lt": now}},
+                ],
+            },
+            {
+                "$set": {
+                    "lease_owner": self.worker_id,
+                    "lease_until": now + datetime.timedelta(seconds=LEASE_SECONDS),
+                }
+            },
+        )
+        return record is not None
 
     async def call_timer(self, timer: Timer) -> None:
         await self.bot.db.reminders.delete({"_id": timer.id})
+        lag = (discord.utils.utcnow() - timer.expires).total_seconds()
+        self.timer_lag.observe(max(lag, 0.0), event=timer.event)
         # dispatch the event
         event_name = f"{timer.event}_timer_complete"
         self.bot.dispatch(event_name, timer)
@@ -221,12 +492,15 @@ class Reminder(commands.Cog):
                 # so we're gonna cap it off at 40 days
                 # see: http://bugs.python.org/issue20493
                 timer = self._current_timer = await self.wait_for_active_timers(days=40)
+                if timer is None:
+                    continue
                 now = discord.utils.utcnow()
 
                 if timer.expires >= now:
                     to_sleep = (timer.expires - now).total_seconds()
                     await asyncio.sleep(to_sleep)
-                await self.call_timer(timer)
+                if await self.claim_timer(timer):
+                    await self.call_timer(timer)
         except asyncio.CancelledError:
             raise
         except (OSError, discord.ConnectionClosed, PyMongoError):
@@ -279,17 +553,33 @@ class Reminder(commands.Cog):
             # a shortcut for small timers
             self.bot.loop.create_task(self.short_timer_optimisation(delta, timer))
             return timer
+        shard_id = self.shard_for_channel(kwargs.get("channel"))
         data = {
             "event": event,
             "expires": when,
             "created": now,
+            "shard": shard_id,
         }
         data.update({"kwargs": kwargs})
         await self.bot.db.reminders.insert(data)
         # timer.id = row[0]
 
+        if self.owns_shard(shard_id):
+            self.wake_dispatcher(when, now)
+        elif self.bot.ipc is not None:
+            await self.bot.ipc.request(
+                "reminder_wake",
+                timeout=1.0,
+                shard=shard_id,
+                expires=when.timestamp(),
+                created=now.timestamp(),
+            )
+
+        return timer
+
+    def wake_dispatcher(self, when: datetime.datetime, now: datetime.datetime) -> None:
         # only set the data check if it can be waited on
-        if delta <= (86400 * 40):  # 40 days
+        if (when - now).total_seconds() <= (86400 * 40):  # 40 days
             self._have_data.set()
 
         # check if this timer is earlier than our currently run timer
@@ -298,7 +588,14 @@ class Reminder(commands.Cog):
             self._task.cancel()
             self._task = self.bot.loop.create_task(self.dispatch_timers())
 
-        return timer
+    async def ipc_wake(self, data: Dict[str, Any]) -> None:
+        if not self.owns_shard(data["shard"]):
+            return
+        utc = datetime.timezone.utc
+        self.wake_dispatcher(
+            datetime.datetime.fromtimestamp(data["expires"], tz=utc),
+            datetime.datetime.fromtimestamp(data["created"], tz=utc),
+        )
 
     @commands.hybrid_group(aliases=["timer", "remind", "remindme"], usage="<when>")
     async def reminder(
@@ -352,7 +649,8 @@ class Reminder(commands.Cog):
     ):
         """Sets a reminder to remind you of something at a specific time."""
 
-        await interaction.response.defer()
+        if not interaction.response.is_done():
+            await interaction.response.defer()
         message = await interaction.original_response()
         timer = await self.create_timer(
             when,
@@ -368,53 +666,90 @@ class Reminder(commands.Cog):
             f"Alright {interaction.user.mention}, in {delta}: {text}"
         )
 
+    async def _preview(
+        self, text: str, *, now: datetime.datetime, tzinfo: datetime.tzinfo
+    ) -> Optional[app_commands.Choice[str]]:
+        try:
+            dt = (await time.FutureTime.parse(text, now=now, tzinfo=tzinfo)).dt
+        except commands.BadArgument:
+            return None
+
+        delta = time.human_timedelta(dt, source=now)
+        name = f"{text} → {dt:%a %d %b %Y, %H:%M} (in {delta})"
+        # a timestamp is resolved by the fast path when the command runs
+        return app_commands.Choice(
+            name=textwrap.shorten(name, 100), value=f"<t:{int(dt.timestamp())}>"
+        )
+
+    @reminder_set.autocomplete("when")
+    async def reminder_set_when_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> List[app_commands.Choice[str]]:
+        user_id = interaction.user.id
+        self._autocomplete_latest[user_id] = interaction.id
+        await asyncio.sleep(AUTOCOMPLETE_DEBOUNCE)
+        if self._autocomplete_latest.get(user_id) != interaction.id:
+            # the user kept typing, Discord ignores the stale response anyway
+            self.autocomplete_total.inc(outcome="debounced")
+            return []
+        del self._autocomplete_latest[user_id]
+
+        current = current.strip()[: time.MAX_TIME_LENGTH]
+        lowered = current.lower()
+        candidates = [current] if current else []
+        candidates.extend(
+            t for t in SUGGESTED_TIMES if t.startswith(lowered) and t != lowered
+        )
+
+        tzinfo = await self.get_tzinfo(user_id)
+        now = interaction.created_at
+        choices = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + AUTOCOMPLETE_BUDGET
+        outcome = "answered"
+        for text in candidates[:5]:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                outcome = "timeout"
+                break
+            try:
+                # a cancelled parse still finishes and lands in the parse cache
+                choice = await asyncio.wait_for(
+                    self._preview(text, now=now, tzinfo=tzinfo), remaining
+                )
+            except asyncio.TimeoutError:
+                outcome = "timeout"
+                break
+            if choice is not None:
+                choices.append(choice)
+
+        self.autocomplete_total.inc(outcome=outcome)
+        return choices
+
     @reminder_set.error
     async def reminder_set_error(
         self, interaction: discord.Interaction, error: app_commands.AppCommandError
     ):
         if isinstance(error, time.BadTimeTransform):
-            await interaction.response.send_message(str(error), ephemeral=True)
+            await respond(interaction, str(error), ephemeral=True)
 
     @reminder.command(name="list", ignore_extra=False)
     async def reminder_list(self, ctx: Context):
-        """Shows the 10 latest currently running reminders."""
-        cur = (
-            self.bot.db.reminders.create_cursor()
-            .set_limit(10)
-            .set_filter(
-                {
-                    "event": "reminder",
-                    "kwargs.author": ctx.author.id,
-                }
-            )
-            .set_sort(("expires", alaric.Ascending))
-        )
-
-        records = [c async for c in cur]
-
-        if len(records) == 0:
+        """Shows your currently running reminders, soonest first."""
+        source = ReminderPageSource(self.bot, ctx.author.id)
+        await source._prepare_once()
+        if source.total == 0:
             return await ctx.send("No currently running reminders.")
 
-        e = discord.Embed(colour=discord.Colour.blurple(), title="Reminders")
-
-        if len(records) == 10:
-            e.set_footer(text="Only showing up to 10 reminders.")
-        else:
-            e.set_footer(
-                text=f'{len(records)} reminder{"s" if len(records) > 1 else ""}'
-            )
-
-        for record in records:
-            shorten = textwrap.shorten(record["kwargs"]["message"], width=512)
-            e.add_field(
-                name=f"{record['_id']}: {time.format_relative(record['expires'])}",
-                value=shorten,
-                inline=False,
-            )
-
-        await ctx.send(embed=e)
+        pages = PersistentPages(source, owner_id=ctx.author.id)
+        await pages.start(ctx)
 
-    @reminder.command(name="delete", aliases=["remove", "cancel"], ignore_extra=False)
+    @reminder.command(
+        name="delete",
+        aliases=["remove", "cancel"],
+        ignore_extra=False,
+        extras={"ephemeral": True},
+    )
     async def reminder_delete(self, ctx: Context, *, _id: int):
         """Deletes a reminder by its ID.
 
@@ -440,7 +775,7 @@ class Reminder(commands.Cog):
 
         await ctx.send("Successfully deleted reminder.", ephemeral=True)
 
-    @reminder.command(name="clear", ignore_extra=False)
+    @reminder.command(name="clear", ignore_extra=False, extras={"ephemeral": True})
     async def reminder_clear(self, ctx: Context):
         """Clears all reminders you have set."""
 
@@ -476,6 +811,42 @@ class Reminder(commands.Cog):
             ephemeral=True,
         )
 
+    @commands.hybrid_group(
+        invoke_without_command=True, fallback="info", extras={"ephemeral": True}
+    )
+    async def timezone(self, ctx: Context):
+        """Shows the timezone your times are parsed in."""
+        tzinfo = await self.get_tzinfo(ctx.author.id)
+        now = datetime.datetime.now(tzinfo)
+        await ctx.send(
+            f"Your timezone is {tzinfo}, it is currently {now:%H:%M} there.",
+            ephemeral=True,
+        )
+
+    @timezone.command(name="set", extras={"ephemeral": True})
+    @app_commands.describe(tz="The timezone to use, e.g. Europe/London.")
+    async def timezone_set(self, ctx: Context, *, tz: Annotated[str, time.TimeZone]):
+        """Sets the timezone times you give the bot are in."""
+        await self.bot.db.timezones.upsert({"_id": ctx.author.id}, {"timezone": tz})
+        self._cache_tzinfo(ctx.author.id, zoneinfo.ZoneInfo(tz))
+        await ctx.send(f"Your timezone has been set to {tz}.", ephemeral=True)
+
+    @timezone_set.autocomplete("tz")
+    async def timezone_set_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> List[app_commands.Choice[str]]:
+        return [
+            app_commands.Choice(name=name, value=name)
+            for name in time.search_timezones(current)
+        ]
+
+    @timezone.command(name="clear", extras={"ephemeral": True})
+    async def timezone_clear(self, ctx: Context):
+        """Goes back to parsing your times in UTC."""
+        await self.bot.db.timezones.delete({"_id": ctx.author.id})
+        self._cache_tzinfo(ctx.author.id, datetime.timezone.utc)
+        await ctx.send("Your timezone has been reset to UTC.", ephemeral=True)
+
     @commands.Cog.listener()
     async def on_reminder_timer_complete(self, timer: Timer):
         author_id, channel_id, message = (
@@ -484,32 +855,26 @@ class Reminder(commands.Cog):
             timer.kwargs["message"],
         )
 
-        try:
-            channel = self.bot.get_channel(channel_id) or (
-                await self.bot.fetch_channel(channel_id)
-            )
-        except discord.HTTPException:
+        channel = await self.bot.get_or_fetch_channel(channel_id)
+        if channel is None:
             return
 
         guild_id = (
             channel.guild.id
             if isinstance(channel, (discord.TextChannel, discord.Thread))
-            else "@me"
+            else None
         )
         message_id = timer.kwargs.get("message_id")
         msg = f"<@{author_id}>, {timer.human_delta}: {message}"
         view = discord.utils.MISSING
 
         if message_id:
-            url = f"https://discord.com/channels/{guild_id}/{channel.id}/{message_id}"
-            view = ReminderView(url=url, timer=timer, cog=self, author_id=author_id)
+            url = reminder_jump_url(guild_id, channel.id, message_id)
+            view = ReminderView(url=url, author_id=author_id, message_id=message_id)
 
         try:
-            msg = await channel.send(
+            await channel.send(
                 msg, view=view, allowed_mentions=discord.AllowedMentions(users=True)
             )  # type: ignore
         except discord.HTTPException:
             return
-        else:
-            if view is not discord.utils.MISSING:
-                view.message = msg
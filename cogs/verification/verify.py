@@ -67,9 +67,12 @@ class Verification(commands.Cog):
 
     async def clear_cache(self) -> Never:
         while True:
-            for user, otp in self.__verify_otp.copy().items():
-                if otp["expires"] < discord.utils.utcnow():
-                    del self.__verify_otp[user]
+            now = discord.utils.utcnow()
+            expired = [
+                u for u, otp in self.__verify_otp.items() if otp["expires"] < now
+            ]
+            for user in expired:
+                del self.__verify_otp[user]
 
             await asyncio.sleep(60)
 
@@ -8,6 +8,8 @@ import discord
 from discord.ui import Modal, TextInput, View, button
 from dotenv import load_dotenv
 
+from utils.interactions import respond
+
 if TYPE_CHECKING:
     from utils.context import Context
 
@@ -42,16 +44,19 @@ class SetEmailModal(Modal, title="Edit Email Address"):
         if not re.fullmatch(EMAIL_RE, self.email.value):
             await interaction.response.send_message("Invalid Email!", ephemeral=True)
             return
-        found = await self.view.ctx.bot.db.verification.find({"email": self.email.value})
+        found = await self.view.ctx.bot.db.verification.find(
+            {"email": self.email.value}
+        )
         if found:
             # email is already been used to verify another person
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 "This email has already been used to verify another party!",
                 ephemeral=True,
             )
             return
         self.view.email = self.email.value
-        await interaction.response.send_message("Email Set!", ephemeral=True)
+        await respond(interaction, "Email Set!", ephemeral=True)
 
 
 class VerifyModal(Modal, title="OTP"):
@@ -83,7 +88,8 @@ class VerifyModal(Modal, title="OTP"):
             await interaction.response.send_message("Invalid OTP!", ephemeral=True)
             return
 
-        await interaction.response.defer()
+        if not interaction.response.is_done():
+            await interaction.response.defer()
 
         data = {
             "_id": interaction.user.id,
@@ -91,6 +97,7 @@ class VerifyModal(Modal, title="OTP"):
         }
 
         await self.view.ctx.bot.db.verification.insert(data)
+        self.view.ctx.bot.member_cache.add_verified(interaction.user.id)
 
         self.view.stop()
         if ROLES_ON_VERIFICATION:
@@ -133,7 +140,8 @@ class VerifyView(View):
                 "You need to set an email!", ephemeral=True
             )
             return
-        await interaction.response.defer(ephemeral=True)
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True)
         otp = self.cog.get_otp(interaction.user.id)
         if otp:
             await interaction.followup.send(
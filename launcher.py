@@ -3,13 +3,22 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import math
+import multiprocessing
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import random
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List, Optional
 
+import aiohttp
 import discord
+import orjson
 from dotenv import load_dotenv
 
 from bot import UniversityBot
+from utils.ipc import IPCServer
 
 try:
     import uvloop  # type: ignore
@@ -29,6 +38,18 @@ os.environ["JISHAKU_NO_UNDERSCORE"] = "True"
 os.environ["JISHAKU_NO_DM_TRACEBACK"] = "True"
 os.environ["JISHAKU_HIDE"] = "True"
 
+# Cluster mode is enabled by setting CLUSTER_COUNT above zero
+CLUSTER_COUNT: int = int(os.getenv("CLUSTER_COUNT", "0"))
+# Defaults to Discord's recommended shard count
+SHARD_COUNT: Optional[int] = int(os.getenv("SHARD_COUNT", "0")) or None
+IPC_PORT: int = int(os.getenv("IPC_PORT", "8765"))
+# "text" or "json" for the log file
+LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text").lower()
+# e.g. "discord.gateway=0.1,discord.client=0.5", only applies below WARNING
+LOG_SAMPLING: str = os.getenv("LOG_SAMPLING", "")
+
+log = logging.getLogger("launcher")
+
 
 class RemoveNoise(logging.Filter):
     def __init__(self):
@@ -40,11 +61,57 @@ class RemoveNoise(logging.Filter):
         return True
 
 
+class SampleNoisy(logging.Filter):
+    """Keeps only a fraction of the sub-WARNING records of noisy loggers."""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates: Dict[str, float] = rates
+
+    @classmethod
+    def from_string(cls, value: str) -> SampleNoisy:
+        rates = {}
+        for entry in filter(None, value.split(",")):
+            name, _, rate = entry.partition("=")
+            rates[name.strip()] = float(rate)
+        return cls(rates)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rates.get(record.name)
+        return rate is None or random.random() < rate
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
 @contextlib.contextmanager
-def setup_logging():
+def setup_logging(filename: str = "logs/console.log"):
     log = logging.getLogger()
+    listener: Optional[QueueListener] = None
+    handlers: List[logging.Handler] = []
 
     try:
+        # a forked cluster inherits the launcher's queue handler, but the
+        # listener draining that queue only runs in the launcher
+        for hdlr in log.handlers[:]:
+            if isinstance(hdlr, QueueHandler):
+                log.removeHandler(hdlr)
+
         discord.utils.setup_logging()
         # __enter__
         max_bytes = 32 * 1024 * 1024  # 32 MiB
@@ -54,34 +121,167 @@ def setup_logging():
 
         log.setLevel(logging.INFO)
         handler = RotatingFileHandler(
-            filename="logs/console.log",
+            filename=filename,
             encoding="utf-8",
             mode="w",
             maxBytes=max_bytes,
             backupCount=5,
         )
         dt_fmt = "%Y-%m-%d %H:%M:%S"
-        fmt = logging.Formatter(
-            "[{asctime}] [{levelname:<7}] {name}: {message}", dt_fmt, style="{"
-        )
+        if LOG_FORMAT == "json":
+            fmt = JSONFormatter(datefmt=dt_fmt)
+        else:
+            fmt = logging.Formatter(
+                "[{asctime}] [{levelname:<7}] {name}: {message}", dt_fmt, style="{"
+            )
         handler.setFormatter(fmt)
-        log.addHandler(handler)
+
+        # The actual handlers write from a background thread so logging never
+        # does disk or console I/O on the event loop.
+        handlers = [*log.handlers, handler]
+        for hdlr in log.handlers[:]:
+            log.removeHandler(hdlr)
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        if LOG_SAMPLING:
+            queue_handler.addFilter(SampleNoisy.from_string(LOG_SAMPLING))
+        log.addHandler(queue_handler)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
 
         yield
 
     finally:
         # __exit__
+        if listener is not None:
+            listener.stop()
+        for hdlr in handlers:
+            hdlr.close()
         handlers = log.handlers[:]
         for hdlr in handlers:
             hdlr.close()
             log.removeHandler(hdlr)
 
 
-async def run_bot():
-    async with UniversityBot() as bot:
+async def run_bot(**kwargs):
+    async with UniversityBot(**kwargs) as bot:
         await bot.start()
 
 
+async def fetch_shard_count() -> int:
+    """Asks Discord for the recommended number of shards."""
+    token = os.getenv("DEV_TOKEN" if os.name == "nt" else "TOKEN", os.getenv("TOKEN"))
+    async with aiohttp.ClientSession() as session:
+        async with session.get(
+            "https://discord.com/api/v10/gateway/bot",
+            headers={"Authorization": f"Bot {token}"},
+        ) as resp:
+            resp.raise_for_status()
+            data = await resp.json()
+    return data["shards"]
+
+
+def run_cluster(
+    cluster_id: int, shard_ids: List[int], shard_count: int, ipc_port: int
+) -> None:
+    with setup_logging(f"logs/cluster-{cluster_id}.log"):
+        asyncio.run(
+            run_bot(
+                shard_ids=shard_ids,
+                shard_count=shard_count,
+                cluster_id=cluster_id,
+                ipc_port=ipc_port,
+            )
+        )
+
+
+class Cluster:
+    """A worker process running :class:`UniversityBot` for a range of shards."""
+
+    def __init__(self, cluster_id: int, shard_ids: List[int], shard_count: int):
+        self.id: int = cluster_id
+        self.shard_ids: List[int] = shard_ids
+        self.shard_count: int = shard_count
+        self.process: Optional[multiprocessing.Process] = None
+        self.restarts: int = 0
+        self.started_at: float = 0.0
+
+    def start(self) -> None:
+        self.process = multiprocessing.Process(
+            target=run_cluster,
+            args=(self.id, self.shard_ids, self.shard_count, IPC_PORT),
+            name=f"cluster-{self.id}",
+            daemon=True,
+        )
+        self.process.start()
+        self.started_at = time.monotonic()
+        log.info(
+            "Started cluster %s (PID: %s) with shards %s.",
+            self.id,
+            self.process.pid,
+            self.shard_ids,
+        )
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def stop(self) -> None:
+        if self.is_alive():
+            self.process.terminate()  # type: ignore  # checked by is_alive
+            self.process.join(10)  # type: ignore
+
+
+async def run_clusters() -> None:
+    shard_count = SHARD_COUNT or await fetch_shard_count()
+    per_cluster = math.ceil(shard_count / CLUSTER_COUNT)
+    clusters = [
+        Cluster(
+            i, list(range(start, min(start + per_cluster, shard_count))), shard_count
+        )
+        for i, start in enumerate(range(0, shard_count, per_cluster))
+    ]
+    log.info("Launching %s shards over %s clusters.", shard_count, len(clusters))
+
+    server = IPCServer(port=IPC_PORT)
+    await server.start()
+
+    backoff: Dict[int, float] = {}
+    try:
+        for cluster in clusters:
+            cluster.start()
+            # each shard needs ~5 seconds to identify, don't overlap clusters
+            await asyncio.sleep(5 * len(cluster.shard_ids))
+
+        while True:
+            await asyncio.sleep(5)
+            for cluster in clusters:
+                if cluster.is_alive():
+                    # only forget the backoff once the cluster looks stable
+                    if time.monotonic() - cluster.started_at > 60:
+                        backoff.pop(cluster.id, None)
+                    continue
+
+                delay = backoff.get(cluster.id, 5.0)
+                log.warning(
+                    "Cluster %s exited with code %s, restarting in %.0fs.",
+                    cluster.id,
+                    cluster.process.exitcode if cluster.process else None,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                backoff[cluster.id] = min(delay * 2, 300.0)
+                cluster.restarts += 1
+                cluster.start()
+    finally:
+        for cluster in clusters:
+            cluster.stop()
+        await server.close()
+
+
 if __name__ == "__main__":
-    with setup_logging():
-        asyncio.run(run_bot())
+    if CLUSTER_COUNT > 0:
+        with setup_logging("logs/launcher.log"):
+            asyncio.run(run_clusters())
+    else:
+        with setup_logging():
+            asyncio.run(run_bot())
@@ -0,0 +1,37 @@
+from utils import singleflight
+from utils.singleflight import SingleFlight
+
+
+def test_negative_cache_stays_bounded_without_expiry():
+    flights = SingleFlight(negative_ttl=60.0, max_negative=100)
+    for key in range(1000):
+        flights.mark_missing(key)
+        assert flights.negative_size <= 100
+
+    # the oldest keys were evicted, the newest are still remembered
+    assert not flights.is_missing(0)
+    assert flights.is_missing(999)
+    assert flights.is_missing(900)
+
+
+def test_negative_cache_drops_expired_keys(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(singleflight.time, "monotonic", lambda: now)
+    flights = SingleFlight(negative_ttl=30.0, max_negative=100)
+    for key in range(10):
+        flights.mark_missing(key)
+
+    now += 31.0
+    flights.mark_missing("new")
+    assert flights.negative_size == 1
+    assert flights.is_missing("new")
+
+
+def test_marking_again_refreshes_a_key():
+    flights = SingleFlight(negative_ttl=60.0, max_negative=3)
+    for key in ("a", "b", "c"):
+        flights.mark_missing(key)
+    flights.mark_missing("a")
+    flights.mark_missing("d")
+    assert flights.is_missing("a")
+    assert not flights.is_missing("b")
@@ -0,0 +1,68 @@
+import datetime
+
+import pytest
+
+from utils import time
+
+UTC = datetime.timezone.utc
+# a Monday
+MONDAY = datetime.datetime(2025, 3, 3, 14, 27, 33, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    time.parse_cache.clear()
+    yield
+    time.parse_cache.clear()
+
+
+def fresh(kind, argument, now):
+    return time._PARSERS[kind](argument, time._wall_clock(now))
+
+
+@pytest.mark.parametrize("kind", ["dt", "nlp"])
+@pytest.mark.parametrize(
+    "argument", ["friday", "december 25", "tomorrow", "2030-01-01", "in 3 days"]
+)
+def test_date_only_phrase_across_days(kind, argument):
+    first = time.parse_blocking(kind, argument, MONDAY)
+    assert first.dt == fresh(kind, argument, MONDAY).dt
+
+    later_today = MONDAY + datetime.timedelta(hours=2)
+    assert time.parse_blocking(kind, argument, later_today).dt == (
+        fresh(kind, argument, later_today).dt
+    )
+
+    for days in (1, 3, 4):
+        later = MONDAY + datetime.timedelta(days=days, minutes=5)
+        assert time.parse_blocking(kind, argument, later).dt == (
+            fresh(kind, argument, later).dt
+        )
+
+
+def test_friday_from_thursday_is_the_same_week():
+    time.parse_blocking("dt", "friday", MONDAY)
+    thursday = MONDAY + datetime.timedelta(days=3)
+    parsed = time.parse_blocking("dt", "friday", thursday)
+    assert parsed.dt.date() == datetime.date(2025, 3, 7)
+
+
+def test_relative_phrase_is_stored_as_offset():
+    time.parse_blocking("dt", "in 5 hours", MONDAY)
+    later = MONDAY + datetime.timedelta(days=2, hours=3)
+    parsed = time.parse_blocking("dt", "in 5 hours", later)
+    assert time.parse_cache.hits == 1
+    assert parsed.dt == time._wall_clock(later) + datetime.timedelta(hours=5)
+
+
+def test_human_timedeltas_matches_human_timedelta():
+    dts = [
+        MONDAY + datetime.timedelta(seconds=90),
+        MONDAY - datetime.timedelta(days=3, hours=4),
+        MONDAY + datetime.timedelta(days=75),
+        (MONDAY + datetime.timedelta(hours=5)).replace(tzinfo=None),
+    ]
+    for brief in (False, True):
+        assert time.human_timedeltas(dts, source=MONDAY, brief=brief) == [
+            time.human_timedelta(dt, source=MONDAY, brief=brief) for dt in dts
+        ]
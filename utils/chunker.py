@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Set
+
+import discord
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+
+log = logging.getLogger(__name__)
+
+__all__ = ["ChunkStrategy", "GuildChunker"]
+
+
+class ChunkStrategy:
+    """The supported ways of filling the member cache.
+
+    ``startup``
+        discord.py's default, READY is delayed until every guild is chunked.
+    ``background``
+        READY fires immediately, guilds are then chunked smallest first.
+    ``lazy``
+        Guilds are only chunked the first time a member lookup misses.
+    """
+
+    STARTUP = "startup"
+    BACKGROUND = "background"
+    LAZY = "lazy"
+
+    ALL = (STARTUP, BACKGROUND, LAZY)
+
+
+class GuildChunker:
+    """Requests guild member chunks off the READY path.
+
+    Chunk requests are deduplicated per guild and bounded by a semaphore so a
+    handful of large guilds cannot monopolise the gateway.
+    """
+
+    def __init__(
+        self, bot: UniversityBot, *, concurrency: int = 2, enabled: bool = True
+    ) -> None:
+        self.bot: UniversityBot = bot
+        self.enabled: bool = enabled
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._pending: Dict[int, asyncio.Task[None]] = {}
+        self._background: Optional[asyncio.Task[None]] = None
+        self._completed: Set[int] = set()
+        self.timings: Dict[int, float] = {}
+
+    @property
+    def progress(self) -> tuple[int, int]:
+        """Returns ``(chunked, total)`` guild counts."""
+        guilds = self.bot.guilds
+        return sum(1 for g in guilds if g.chunked), len(guilds)
+
+    def is_pending(self, guild: discord.Guild) -> bool:
+        return guild.id in self._pending
+
+    def request(self, guild: discord.Guild) -> Optional[asyncio.Task[None]]:
+        """Schedules a chunk of the guild if it is not already chunked.
+
+        This never blocks, the returned task can be awaited if the caller
+        needs the member cache to be complete.
+
+        Guilds are only chunked once, a member cache policy may trim them
+        afterwards and re-chunking would undo that.
+        """
+        if not self.enabled or guild.chunked or guild.id in self._completed:
+            return None
+
+        task = self._pending.get(guild.id)
+        if task is None:
+            task = asyncio.create_task(self._chunk(guild))
+            self._pending[guild.id] = task
+        return task
+
+    async def _chunk(self, guild: discord.Guild) -> None:
+        try:
+            async with self._semaphore:
+                if guild.chunked:
+                    return
+                start = time.perf_counter()
+                await guild.chunk(cache=True)
+                elapsed = time.perf_counter() - start
+                self._completed.add(guild.id)
+                # chunked members don't fire join events
+                self.bot.name_index.invalidate(guild.id)
+                self.timings[guild.id] = elapsed
+                done, total = self.progress
+                log.info(
+                    "Chunked guild %s (ID: %s, %s members) in %.2fs [%s/%s]",
+                    guild.name,
+                    guild.id,
+                    guild.member_count,
+                    elapsed,
+                    done,
+                    total,
+                )
+        except (asyncio.TimeoutError, discord.ClientException):
+            log.warning("Failed to chunk guild %s (ID: %s).", guild.name, guild.id)
+        finally:
+            self._pending.pop(guild.id, None)
+
+    def start_background(self) -> None:
+        """Starts chunking every guild in ascending member count order."""
+        if self._background is None or self._background.done():
+            self._background = asyncio.create_task(self._chunk_all())
+
+    async def _chunk_all(self) -> None:
+        guilds = sorted(
+            (g for g in self.bot.guilds if not g.chunked),
+            key=lambda g: g.member_count or 0,
+        )
+        if not guilds:
+            return
+
+        log.info("Background chunking %s guilds.", len(guilds))
+        start = time.perf_counter()
+        await asyncio.gather(*filter(None, (self.request(g) for g in guilds)))
+        log.info("Background chunking finished in %.2fs.", time.perf_counter() - start)
+
+    def cancel(self) -> None:
+        if self._background is not None:
+            self._background.cancel()
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
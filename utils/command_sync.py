@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import discord
+import orjson
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+
+log = logging.getLogger(__name__)
+
+__all__ = ["tree_hash", "sync_commands"]
+
+# the config document holding the hash of the last synced tree per scope
+CONFIG_ID = "command_tree"
+
+
+def _scope(guild_id: Optional[int]) -> str:
+    return "global" if guild_id is None else str(guild_id)
+
+
+def tree_hash(bot: UniversityBot, guild_id: Optional[int] = None) -> str:
+    """Hashes the payload :meth:`~discord.app_commands.CommandTree.sync` would send.
+
+    Commands are sorted by type and name and keys are sorted, so the hash only
+    changes when the commands themselves do.
+    """
+    tree = bot.tree
+    guild = discord.Object(id=guild_id) if guild_id is not None else None
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda c: (c.get("type", 1), c["name"]),
+    )
+    return hashlib.sha256(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+
+
+async def sync_commands(bot: UniversityBot, *, force: bool = False) -> List[str]:
+    """Syncs the global and per guild command trees whose hash changed.
+
+    Returns the scopes that were synced, ``global`` or a guild id.
+    """
+    config = await bot.db.config.find({"_id": CONFIG_ID}) or {}
+    stored: Dict[str, str] = config.get("hashes", {})
+
+    # guild specific commands are only reachable through the tree internals
+    scopes: List[Optional[int]] = [None, *bot.tree._guild_commands]
+    synced = []
+    for guild_id in scopes:
+        scope = _scope(guild_id)
+        digest = tree_hash(bot, guild_id)
+        if not force and stored.get(scope) == digest:
+            log.debug("Command tree for %s is unchanged, not syncing.", scope)
+            continue
+
+        guild = discord.Object(id=guild_id) if guild_id is not None else None
+        try:
+            await bot.tree.sync(guild=guild)
+        except discord.HTTPException:
+            log.exception("Failed to sync the command tree for %s.", scope)
+            continue
+
+        await bot.db.config.upsert({"_id": CONFIG_ID}, {f"hashes.{scope}": digest})
+        synced.append(scope)
+        log.info("Synced the command tree for %s.", scope)
+
+    return synced
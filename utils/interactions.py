@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict
+
+import discord
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+
+log = logging.getLogger(__name__)
+
+__all__ = ["InteractionWatchdog", "respond"]
+
+# interactions that can be deferred, autocomplete has to be answered directly
+DEFERRABLE = (
+    discord.InteractionType.application_command,
+    discord.InteractionType.component,
+    discord.InteractionType.modal_submit,
+)
+
+
+def _command_name(interaction: discord.Interaction) -> str:
+    command = interaction.command
+    if command is not None:
+        return command.qualified_name
+    return interaction.type.name
+
+
+async def respond(interaction: discord.Interaction, *args: Any, **kwargs: Any) -> None:
+    """Sends a message as the interaction response or as a followup once it
+    has already been responded to, e.g. by the :class:`InteractionWatchdog`.
+    """
+    if interaction.response.is_done():
+        await interaction.followup.send(*args, **kwargs)
+    else:
+        await interaction.response.send_message(*args, **kwargs)
+
+
+class InteractionWatchdog:
+    """Defers interactions whose handler has not responded within ``budget`` seconds.
+
+    Discord fails an interaction that is not responded to within 3 seconds,
+    deferring gives the handler 15 minutes to send a followup instead.
+    Application commands are deferred with a thinking message, publicly
+    unless the command has ``extras={"ephemeral": True}``. Components and
+    modals are deferred as a message update, their handlers then edit the
+    original response instead. Commands that respond with a modal or need
+    the first response for themselves opt out with
+    ``extras={"auto_defer": False}``. Interactions that arrive with no
+    budget left are left alone, since deferring them at once would race
+    the handler's own response.
+    """
+
+    def __init__(self, bot: UniversityBot, *, budget: float = 2.0) -> None:
+        self.bot: UniversityBot = bot
+        self.budget: float = budget
+        self.deferred_total = bot.metrics.counter(
+            "interactions_auto_deferred_total",
+            "Interactions deferred because their handler was too slow to respond.",
+        )
+        self.failed_total = bot.metrics.counter(
+            "interactions_auto_defer_failed_total",
+            "Interactions the watchdog could not defer in time.",
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget > 0
+
+    def watch(self, interaction: discord.Interaction) -> None:
+        if not self.enabled or interaction.type not in DEFERRABLE:
+            return
+
+        # the budget counts from when Discord created the interaction
+        age = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        remaining = self.budget - age
+        if remaining <= 0:
+            return
+        # a timer handle is a lot cheaper than a task per interaction
+        delay = min(remaining, self.budget)
+        asyncio.get_running_loop().call_later(delay, self._expire, interaction)
+
+    def _expire(self, interaction: discord.Interaction) -> None:
+        if interaction.response.is_done():
+            return
+        if not self._extras(interaction).get("auto_defer", True):
+            return
+        asyncio.create_task(self._defer(interaction))
+
+    def _extras(self, interaction: discord.Interaction) -> Dict[Any, Any]:
+        command = interaction.command
+        if command is None:
+            return {}
+        # hybrid commands keep their extras on the text command
+        return getattr(command, "wrapped", command).extras
+
+    def _ephemeral(self, interaction: discord.Interaction) -> bool:
+        return self._extras(interaction).get("ephemeral", False)
+
+    async def _defer(self, interaction: discord.Interaction) -> None:
+        name = _command_name(interaction)
+        try:
+            if interaction.type is discord.InteractionType.application_command:
+                await interaction.response.defer(
+                    ephemeral=self._ephemeral(interaction), thinking=True
+                )
+            else:
+                await interaction.response.defer()
+        except discord.InteractionResponded:
+            # the handler won the race
+            return
+        except discord.HTTPException as e:
+            self.failed_total.inc(type=interaction.type.name)
+            log.warning("Could not auto defer interaction for %s: %s", name, e)
+            return
+
+        self.deferred_total.inc(type=interaction.type.name, command=name)
+        log.info(
+            "Auto deferred interaction for %s after %.1fs.",
+            name,
+            (discord.utils.utcnow() - interaction.created_at).total_seconds(),
+        )
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
+
+import orjson
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+
+log = logging.getLogger(__name__)
+
+__all__ = ["IPCServer", "IPCClient"]
+
+Handler = Callable[[Any], Awaitable[Any]]
+
+# Every message is a single line of JSON:
+#   identify  cluster -> server  {"op": "identify", "cluster": int}
+#   request   cluster -> server  {"op": "request", "nonce": str, "data": {"command": str, ...}}
+#   ack       server -> cluster  {"op": "ack", "nonce": str, "expected": int}
+#   command   server -> cluster  {"op": "command", "nonce": str, "origin": int, "data": ...}
+#   response  cluster -> server  {"op": "response", "nonce": str, "target": int, "data": ...}
+#   response  server -> cluster  {"op": "response", "nonce": str, "data": ...}
+
+
+async def _send(writer: asyncio.StreamWriter, payload: Dict[str, Any]) -> None:
+    writer.write(orjson.dumps(payload) + b"\n")
+    await writer.drain()
+
+
+class IPCServer:
+    """Routes requests between cluster processes, run by the launcher."""
+
+    def __init__(self, *, host: str = "127.0.0.1", port: int = 8765) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.clusters: Dict[int, asyncio.StreamWriter] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        log.info("IPC server listening on %s:%s", self.host, self.port)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        cluster_id: Optional[int] = None
+        try:
+            while line := await reader.readline():
+                payload = orjson.loads(line)
+                op = payload.get("op")
+                if op == "identify":
+                    cluster_id = payload["cluster"]
+                    self.clusters[cluster_id] = writer
+                    log.info("Cluster %s connected to IPC.", cluster_id)
+                elif op == "request" and cluster_id is not None:
+                    await self._broadcast(cluster_id, payload)
+                elif op == "response":
+                    target = self.clusters.get(payload.pop("target", None))
+                    if target is not None:
+                        await _send(target, payload)
+        except (ConnectionError, orjson.JSONDecodeError):
+            pass
+        finally:
+            if cluster_id is not None and self.clusters.get(cluster_id) is writer:
+                del self.clusters[cluster_id]
+                log.info("Cluster %s disconnected from IPC.", cluster_id)
+            writer.close()
+
+    async def _broadcast(self, origin: int, payload: Dict[str, Any]) -> None:
+        nonce = payload["nonce"]
+        targets = list(self.clusters.values())
+        await _send(
+            self.clusters[origin],
+            {"op": "ack", "nonce": nonce, "expected": len(targets)},
+        )
+        command = {
+            "op": "command",
+            "nonce": nonce,
+            "origin": origin,
+            "data": payload["data"],
+        }
+        for writer in targets:
+            try:
+                await _send(writer, command)
+            except ConnectionError:
+                pass
+
+
+class _PendingRequest:
+    __slots__ = ("expected", "responses", "done")
+
+    def __init__(self) -> None:
+        self.expected: Optional[int] = None
+        self.responses: List[Any] = []
+        self.done: asyncio.Event = asyncio.Event()
+
+    def check(self) -> None:
+        if self.expected is not None and len(self.responses) >= self.expected:
+            self.done.set()
+
+
+class IPCClient:
+    """A cluster's connection to the launcher's :class:`IPCServer`.
+
+    Commands are registered with :meth:`add_handler` and are run on every
+    cluster when any cluster calls :meth:`request`.
+    """
+
+    def __init__(
+        self, bot: UniversityBot, *, host: str = "127.0.0.1", port: int = 8765
+    ) -> None:
+        self.bot: UniversityBot = bot
+        self.host: str = host
+        self.port: int = port
+        self.handlers: Dict[str, Handler] = {}
+        self._pending: Dict[str, _PendingRequest] = {}
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    def add_handler(self, command: str, handler: Handler) -> None:
+        self.handlers[command] = handler
+
+    async def connect(self) -> None:
+        reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        await _send(self._writer, {"op": "identify", "cluster": self.bot.cluster_id})
+        self._task = asyncio.create_task(self._read_loop(reader))
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        if self._writer is not None:
+            self._writer.close()
+
+    async def request(
+        self, command: str, *, timeout: float = 5.0, **data: Any
+    ) -> List[Any]:
+        """Runs a command on every cluster and returns their responses.
+
+        Clusters that fail to respond within the timeout are left out.
+        """
+        if not self.connected:
+            handler = self.handlers.get(command)
+            return [await handler(data)] if handler else []
+
+        nonce = os.urandom(8).hex()
+        pending = self._pending[nonce] = _PendingRequest()
+        try:
+            await _send(
+                self._writer,  # type: ignore  # checked by connected
+                {"op": "request", "nonce": nonce, "data": {"command": command, **data}},
+            )
+            await asyncio.wait_for(pending.done.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            del self._pending[nonce]
+        return pending.responses
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while line := await reader.readline():
+                payload = orjson.loads(line)
+                op = payload["op"]
+                if op == "command":
+                    asyncio.create_task(self._run_command(payload))
+                    continue
+
+                pending = self._pending.get(payload["nonce"])
+                if pending is None:
+                    continue
+                if op == "ack":
+                    pending.expected = payload["expected"]
+                elif op == "response":
+                    pending.responses.append(payload["data"])
+                pending.check()
+        except (ConnectionError, orjson.JSONDecodeError):
+            pass
+        log.warning("Lost connection to the IPC server.")
+
+    async def _run_command(self, payload: Dict[str, Any]) -> None:
+        data = payload["data"]
+        handler = self.handlers.get(data.pop("command", None))
+        try:
+            result = await handler(data) if handler else None
+        except Exception:
+            log.exception("IPC command %s failed.", payload["data"])
+            result = None
+
+        if self.connected:
+            await _send(
+                self._writer,  # type: ignore  # checked by connected
+                {
+                    "op": "response",
+                    "nonce": payload["nonce"],
+                    "target": payload["origin"],
+                    "data": result,
+                },
+            )
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+
+log = logging.getLogger(__name__)
+
+__all__ = ["LoopMonitor", "StallRecord"]
+
+StackKey = Tuple[Tuple[str, int, str], ...]
+
+
+class StallRecord:
+    __slots__ = ("stack", "count", "total", "worst")
+
+    def __init__(self, stack: traceback.StackSummary) -> None:
+        self.stack: traceback.StackSummary = stack
+        self.count: int = 0
+        self.total: float = 0.0
+        self.worst: float = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.worst = max(self.worst, duration)
+
+    @property
+    def location(self) -> str:
+        frame = self.stack[-1]
+        return f"{frame.filename}:{frame.lineno} in {frame.name}"
+
+    def format(self) -> str:
+        return "".join(self.stack.format())
+
+
+class LoopMonitor:
+    """Measures event loop scheduling lag and samples the stack of stalls.
+
+    A ticker task sleeps for ``interval`` seconds and records how late it was
+    woken up. A watchdog thread notices when the ticker has not run for longer
+    than ``interval + threshold`` and grabs the stack of the event loop
+    thread, which is whatever is blocking it. Stalls are grouped by the
+    innermost frames of that stack so the worst offenders can be listed.
+    """
+
+    def __init__(
+        self,
+        bot: UniversityBot,
+        *,
+        interval: float = 0.25,
+        threshold: float = 0.1,
+        max_records: int = 100,
+    ) -> None:
+        self.bot: UniversityBot = bot
+        self.interval: float = interval
+        self.threshold: float = threshold
+        self.max_records: int = max_records
+        self.current_lag: float = 0.0
+        self.max_lag: float = 0.0
+        self.stalls: Dict[StackKey, StallRecord] = {}
+        self.lag_seconds = bot.metrics.histogram(
+            "event_loop_lag_seconds",
+            "How late the event loop ran a scheduled callback.",
+        )
+        self.stalls_total = bot.metrics.counter(
+            "event_loop_stalls_total", "Event loop stalls longer than the threshold."
+        )
+        self._heartbeat: float = time.monotonic()
+        self._sampled: Optional[traceback.StackSummary] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._tick())
+        self._thread = threading.Thread(
+            target=self._watchdog, name="loop-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def reset(self) -> None:
+        self.max_lag = 0.0
+        self.stalls.clear()
+
+    def worst(self, limit: int = 5) -> List[StallRecord]:
+        """Returns the stall locations with the most time spent blocked."""
+        return sorted(self.stalls.values(), key=lambda r: r.total, reverse=True)[:limit]
+
+    async def _tick(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - start - self.interval, 0.0)
+            self._heartbeat = time.monotonic()
+
+            self.current_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self.lag_seconds.observe(lag)
+
+            sampled, self._sampled = self._sampled, None
+            if lag >= self.threshold:
+                self.stalls_total.inc()
+                if sampled is not None:
+                    self._record(sampled, lag)
+
+    def _record(self, stack: traceback.StackSummary, duration: float) -> None:
+        key: StackKey = tuple((f.filename, f.lineno or 0, f.name) for f in stack[-5:])
+        record = self.stalls.get(key)
+        if record is None:
+            if len(self.stalls) >= self.max_records:
+                # make room by dropping the least significant offender
+                del self.stalls[min(self.stalls, key=lambda k: self.stalls[k].total)]
+            record = self.stalls[key] = StallRecord(stack)
+        record.add(duration)
+        log.warning("Event loop blocked for %.3fs at %s", duration, record.location)
+
+    def _watchdog(self) -> None:
+        period = self.threshold / 2
+        while not self._stop.wait(period):
+            overdue = time.monotonic() - self._heartbeat - self.interval
+            if overdue < self.threshold or self._sampled is not None:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore
+            if frame is not None:
+                self._sampled = traceback.extract_stack(frame)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Set, Tuple, Union
+
+import discord
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+
+log = logging.getLogger(__name__)
+
+__all__ = ["member_cache_flags", "MemberCachePolicy"]
+
+
+def member_cache_flags(
+    profile: str, intents: discord.Intents
+) -> discord.MemberCacheFlags:
+    """Returns the :class:`discord.MemberCacheFlags` for a named profile.
+
+    ``full``
+        Everything the intents allow, discord.py's default.
+    ``minimal``
+        Only members that joined or were chunked, voice state members are
+        not kept around.
+    ``none``
+        No member cache at all, every lookup goes through the API.
+    """
+    profile = profile.lower()
+    if profile == "none":
+        return discord.MemberCacheFlags.none()
+    if profile == "minimal":
+        flags = discord.MemberCacheFlags.none()
+        flags.joined = intents.members
+        return flags
+    return discord.MemberCacheFlags.from_intents(intents)
+
+
+class MemberCachePolicy:
+    """Keeps the member cache under a fixed size.
+
+    Verified members and owners are pinned and never evicted. Recently active
+    members are tracked in LRU order, members that have never been seen
+    active (usually the bulk of a chunked guild) are evicted first and the
+    least recently active after that. Evicted members are transparently
+    resolved again through :meth:`UniversityBot.get_or_fetch_member`.
+    """
+
+    def __init__(self, bot: UniversityBot, *, limit: int = 0) -> None:
+        self.bot: UniversityBot = bot
+        self.limit: int = limit
+        self.evicted: int = 0
+        self._verified: Set[int] = set()
+        self._recent: OrderedDict[Tuple[int, int], None] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit > 0
+
+    async def load_verified(self) -> None:
+        records = await self.bot.db.verification.get_all(projections={"_id": 1})
+        self._verified = {r["_id"] for r in records if r}
+        log.info("Pinned %s verified members in the member cache.", len(self._verified))
+
+    def add_verified(self, user_id: int) -> None:
+        self._verified.add(user_id)
+
+    def is_pinned(self, user_id: int) -> bool:
+        return (
+            user_id in self._verified
+            or user_id in self.bot.owner_ids
+            or user_id == self.bot.user.id  # type: ignore  # only trimmed once logged in
+        )
+
+    def touch(self, member: Union[discord.Member, discord.User, None]) -> None:
+        """Marks a member as recently active."""
+        if not self.enabled or not isinstance(member, discord.Member):
+            return
+
+        key = (member.guild.id, member.id)
+        self._recent[key] = None
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.limit:
+            self._recent.popitem(last=False)
+
+    def size(self) -> int:
+        return sum(len(g._members) for g in self.bot.guilds)
+
+    def _evict(
+        self, guild: discord.Guild, members: Iterable[discord.Member], excess: int
+    ) -> int:
+        removed = 0
+        for member in members:
+            if removed >= excess:
+                break
+            if self.is_pinned(member.id):
+                continue
+            guild._remove_member(member)
+            removed += 1
+        return removed
+
+    def trim(self) -> int:
+        """Evicts members until the cache fits the limit.
+
+        Returns the number of members evicted.
+        """
+        if not self.enabled:
+            return 0
+
+        excess = self.size() - self.limit
+        if excess <= 0:
+            return 0
+
+        removed = 0
+        # cold members first
+        for guild in self.bot.guilds:
+            cold = [
+                m
+                for m in guild._members.values()
+                if (guild.id, m.id) not in self._recent
+            ]
+            removed += self._evict(guild, cold, excess - removed)
+            if removed >= excess:
+                break
+
+        # then the least recently active
+        while removed < excess and self._recent:
+            (guild_id, member_id), _ = self._recent.popitem(last=False)
+            guild = self.bot.get_guild(guild_id)
+            member = guild and guild.get_member(member_id)
+            if member is not None:
+                removed += self._evict(guild, (member,), 1)  # type: ignore  # narrowed above
+
+        self.evicted += removed
+        log.info(
+            "Evicted %s members from the member cache (%s/%s).",
+            removed,
+            self.size(),
+            self.limit,
+        )
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size(),
+            "limit": self.limit,
+            "pinned": len(self._verified),
+            "recent": len(self._recent),
+            "evicted": self.evicted,
+        }
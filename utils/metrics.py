@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+log = logging.getLogger(__name__)
+
+__all__ = ["Counter", "Gauge", "Histogram", "MetricsRegistry", "MetricsServer"]
+
+LabelKey = Tuple[Tuple[str, str], ...]
+Collector = Callable[[], Awaitable[None]]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key)
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    type: str
+
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+            *self.samples(),
+        ]
+
+
+class Counter(_Metric):
+    """A value that only goes up."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        super().__init__(name, documentation)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = _key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: object) -> float:
+        return self._values.get(_key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(k)} {_format_value(v)}"
+            for k, v in self._values.items()
+        ]
+
+
+class Gauge(_Metric):
+    """A value that can go up and down."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        super().__init__(name, documentation)
+        self._values: Dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        self._values[_key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = _key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: object) -> float:
+        return self._values.get(_key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(k)} {_format_value(v)}"
+            for k, v in self._values.items()
+        ]
+
+
+class _HistogramValues:
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.buckets: List[int] = [0] * size
+        self.sum: float = 0.0
+        self.count: int = 0
+
+
+class Histogram(_Metric):
+    """Counts observations into cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation)
+        self.bounds: Tuple[float, ...] = (*sorted(buckets), math.inf)
+        self._values: Dict[LabelKey, _HistogramValues] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = _key(labels)
+        values = self._values.get(key)
+        if values is None:
+            values = self._values[key] = _HistogramValues(len(self.bounds))
+        values.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        values.sum += value
+        values.count += 1
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, values in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.bounds, values.buckets):
+                cumulative += count
+                le = ("le", _format_value(bound))
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(key, le)} {cumulative}"
+                )
+            lines.append(
+                f"{self.name}_sum{_format_labels(key)} {_format_value(values.sum)}"
+            )
+            lines.append(f"{self.name}_count{_format_labels(key)} {values.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds every metric of the process and renders them in the Prometheus text format.
+
+    Collectors are coroutines run right before each scrape, they are meant for
+    gauges that are cheaper to compute on demand than to keep up to date.
+    """
+
+    def __init__(self, *, prefix: str = "university_bot") -> None:
+        self.prefix: str = prefix
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Collector] = []
+
+    def _register(self, cls: type, name: str, documentation: str, **kwargs):
+        full_name = f"{self.prefix}_{name}"
+        metric = self._metrics.get(full_name)
+        if metric is None:
+            metric = self._metrics[full_name] = cls(full_name, documentation, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"{full_name} is already registered as a {metric.type}")
+        return metric
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        return self._register(Counter, name, documentation)
+
+    def gauge(self, name: str, documentation: str) -> Gauge:
+        return self._register(Gauge, name, documentation)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, buckets=buckets)
+
+    def add_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def remove_collector(self, collector: Collector) -> None:
+        try:
+            self._collectors.remove(collector)
+        except ValueError:
+            pass
+
+    async def collect(self) -> None:
+        for collector in self._collectors:
+            try:
+                await collector()
+            except Exception:
+                log.exception("Metrics collector %r failed.", collector)
+
+    async def render(self) -> str:
+        await self.collect()
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves a :class:`MetricsRegistry` on ``/metrics`` over a local HTTP port."""
+
+    def __init__(
+        self, registry: MetricsRegistry, *, host: str = "127.0.0.1", port: int = 9100
+    ) -> None:
+        self.registry: MetricsRegistry = registry
+        self.host: str = host
+        self.port: int = port
+        self._runner: Optional[web.AppRunner] = None
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        from aiohttp import web
+
+        body = await self.registry.render()
+        return web.Response(text=body, content_type="text/plain", charset="utf-8")
+
+    async def start(self) -> None:
+        # aiohttp.web is only needed when the endpoint is enabled
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        log.info("Serving metrics on http://%s:%s/metrics", self.host, self.port)
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
@@ -39,6 +39,10 @@ class MongoManager:
 
         return doc
 
+    async def ping(self) -> None:
+        """Round trips to the server, raising if it can't be reached."""
+        await self.db.command("ping")
+
     def get_current_documents(self) -> List[Document]:
         class_vars = vars(self)
         documents = []
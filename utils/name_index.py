@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple
+
+import discord
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+
+__all__ = ["MemberNameIndex"]
+
+
+def _names_of(member: discord.Member) -> Tuple[str, ...]:
+    name, global_name, nick = member.name, member.global_name, member.nick
+    names = [name]
+    if global_name and global_name != name:
+        names.append(global_name)
+    if nick and nick not in names:
+        names.append(nick)
+    return tuple(names)
+
+
+class _GuildNameIndex:
+    __slots__ = ("exact", "keys", "names")
+
+    def __init__(self) -> None:
+        # exact name -> member ids
+        self.exact: Dict[str, Set[int]] = {}
+        # sorted (casefolded name, member id), searched with bisect for prefixes
+        self.keys: List[Tuple[str, int]] = []
+        # member id -> the names it is indexed under
+        self.names: Dict[int, Tuple[str, ...]] = {}
+
+    def add(self, member: discord.Member) -> None:
+        if member.id in self.names:
+            self.remove(member.id)
+
+        names = _names_of(member)
+        self.names[member.id] = names
+        for name in names:
+            self.exact.setdefault(name, set()).add(member.id)
+            bisect.insort(self.keys, (name.casefold(), member.id))
+
+    def build(self, members: Iterable[discord.Member]) -> None:
+        # like add for every member, without checking for existing entries
+        # and sorting the keys once at the end instead of inserting each one
+        exact, keys = self.exact, self.keys
+        for member in members:
+            member_id = member.id
+            names = self.names[member_id] = _names_of(member)
+            for name in names:
+                ids = exact.get(name)
+                if ids is None:
+                    exact[name] = {member_id}
+                else:
+                    ids.add(member_id)
+                keys.append((name.casefold(), member_id))
+        keys.sort()
+
+    def remove(self, member_id: int) -> None:
+        for name in self.names.pop(member_id, ()):
+            ids = self.exact.get(name)
+            if ids is not None:
+                ids.discard(member_id)
+                if not ids:
+                    del self.exact[name]
+
+            key = (name.casefold(), member_id)
+            index = bisect.bisect_left(self.keys, key)
+            if index < len(self.keys) and self.keys[index] == key:
+                del self.keys[index]
+
+    def prefix(self, query: str, limit: int) -> List[int]:
+        query = query.casefold()
+        found: Dict[int, None] = {}
+        index = bisect.bisect_left(self.keys, (query,))
+        while index < len(self.keys) and len(found) < limit:
+            name, member_id = self.keys[index]
+            if not name.startswith(query):
+                break
+            found[member_id] = None
+            index += 1
+        return list(found)
+
+
+class MemberNameIndex:
+    """An in-memory index of member usernames, global names and nicknames.
+
+    Guilds are indexed from the member cache the first time they are looked
+    up and are then kept up to date from member and user update events.
+    Exact lookups are a dict hit and prefix lookups a binary search over the
+    sorted names, mirroring what the gateway's ``query_members`` would do.
+    Indexing a guild inserts every name and then sorts the names once.
+    """
+
+    def __init__(self, bot: UniversityBot) -> None:
+        self.bot: UniversityBot = bot
+        self._guilds: Dict[int, _GuildNameIndex] = {}
+
+    def _get(self, guild: discord.Guild) -> _GuildNameIndex:
+        index = self._guilds.get(guild.id)
+        if index is None:
+            index = self._guilds[guild.id] = _GuildNameIndex()
+            index.build(guild.members)
+        return index
+
+    def _resolve(
+        self, guild: discord.Guild, member_ids: Iterable[int]
+    ) -> List[discord.Member]:
+        index = self._guilds[guild.id]
+        members = []
+        for member_id in member_ids:
+            member = guild.get_member(member_id)
+            if member is None:
+                # evicted from the member cache since it was indexed
+                index.remove(member_id)
+            else:
+                members.append(member)
+        return members
+
+    def exact(self, guild: discord.Guild, name: str) -> List[discord.Member]:
+        """Returns the members whose username, global name or nickname is ``name``.
+
+        Username matches come first, then global names, then nicknames.
+        """
+        ids = self._get(guild).exact.get(name)
+        if not ids:
+            return []
+
+        def rank(member: discord.Member) -> int:
+            names = (member.name, member.global_name, member.nick)
+            return names.index(name) if name in names else len(names)
+
+        return sorted(self._resolve(guild, list(ids)), key=rank)
+
+    def prefix(
+        self, guild: discord.Guild, query: str, *, limit: int = 5
+    ) -> List[discord.Member]:
+        """Returns up to ``limit`` members with a name starting with ``query``, ignoring case."""
+        return self._resolve(guild, self._get(guild).prefix(query, limit))
+
+    def add(self, member: discord.Member) -> None:
+        index = self._guilds.get(member.guild.id)
+        if index is not None:
+            index.add(member)
+
+    def add_many(self, guild: discord.Guild, members: Iterable[discord.Member]) -> None:
+        index = self._guilds.get(guild.id)
+        if index is not None:
+            for member in members:
+                index.add(member)
+
+    def remove(self, guild_id: int, member_id: int) -> None:
+        index = self._guilds.get(guild_id)
+        if index is not None:
+            index.remove(member_id)
+
+    def update_user(self, user: discord.User) -> None:
+        for guild_id, index in self._guilds.items():
+            if user.id not in index.names:
+                continue
+            guild = self.bot.get_guild(guild_id)
+            member = guild and guild.get_member(user.id)
+            if member is not None:
+                index.add(member)
+
+    def invalidate(self, guild_id: int) -> None:
+        """Drops a guild's index, it is rebuilt on the next lookup."""
+        self._guilds.pop(guild_id, None)
+
+    def __len__(self) -> int:
+        return sum(len(index.names) for index in self._guilds.values())
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import asyncio
+import datetime
+import re
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
 
+import alaric
 import discord
+from bson import ObjectId
 from discord.ext import menus
 from discord.ext.commands import Paginator as CommandPaginator
 
+from utils.interactions import respond
+
 if TYPE_CHECKING:
+    from alaric import Cursor, Document
+    from typing_extensions import Self
+
     from utils.context import Context
 
 __all__ = [
@@ -15,9 +26,37 @@ __all__ = [
     "FieldPageSource",
     "TextPageSource",
     "SimplePageSource",
+    "CursorPageSource",
     "SimplePages",
+    "persistent_page_source",
+    "PageButton",
+    "PersistentPages",
 ]
 
+# How many rendered pages a paginator keeps around
+RENDERED_PAGES = 10
+
+
+def _page_kwargs(value: Any) -> Dict[str, Any]:
+    if isinstance(value, dict):
+        return value
+    elif isinstance(value, str):
+        return {"content": value, "embed": None}
+    elif isinstance(value, discord.Embed):
+        return {"embed": value, "content": None}
+    else:
+        return {}
+
+
+def _copy_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    # sources tend to reuse and mutate one embed for every page
+    copied = dict(kwargs)
+    if isinstance(copied.get("embed"), discord.Embed):
+        copied["embed"] = copied["embed"].copy()
+    if copied.get("embeds"):
+        copied["embeds"] = [embed.copy() for embed in copied["embeds"]]
+    return copied
+
 
 class NumberedPageModal(discord.ui.Modal, title="Go to page"):
     page = discord.ui.TextInput(
@@ -37,6 +76,13 @@ class NumberedPageModal(discord.ui.Modal, title="Go to page"):
 
 
 class RoboPages(discord.ui.View):
+    """A paginator for a :class:`menus.PageSource`.
+
+    Rendered pages are cached unless ``cache_pages`` is disabled, for sources
+    whose pages change while they are shown. Navigating while an edit is in
+    progress only queues the newest page, so rapid clicks end up as one edit.
+    """
+
     def __init__(
         self,
         source: menus.PageSource,
@@ -44,6 +90,7 @@ class RoboPages(discord.ui.View):
         author: discord.Member | discord.User,
         check_embeds: bool = True,
         compact: bool = False,
+        cache_pages: bool = True,
     ):
         super().__init__()
         self.author = author
@@ -52,6 +99,10 @@ class RoboPages(discord.ui.View):
         self.message: Optional[discord.Message] = None
         self.current_page: int = 0
         self.compact: bool = compact
+        self.cache_pages: bool = cache_pages
+        self._rendered: OrderedDict[int, Dict[str, Any]] = OrderedDict()
+        self._editing: bool = False
+        self._queued_page: Optional[int] = None
         self.clear_items()
         self.fill_items()
 
@@ -77,28 +128,59 @@ class RoboPages(discord.ui.View):
 
     async def _get_kwargs_from_page(self, page: int) -> Dict[str, Any]:
         value = await discord.utils.maybe_coroutine(self.source.format_page, self, page)
-        if isinstance(value, dict):
-            return value
-        elif isinstance(value, str):
-            return {"content": value, "embed": None}
-        elif isinstance(value, discord.Embed):
-            return {"embed": value, "content": None}
-        else:
-            return {}
+        return _page_kwargs(value)
+
+    @property
+    def requested_page(self) -> int:
+        """The page shown once the edit in progress, if any, is done."""
+        if self._queued_page is not None:
+            return self._queued_page
+        return self.current_page
+
+    async def _render(self, page_number: int) -> Dict[str, Any]:
+        kwargs = self._rendered.get(page_number)
+        if kwargs is not None:
+            self._rendered.move_to_end(page_number)
+            self.current_page = page_number
+            return kwargs
 
-    async def show_page(
-        self, interaction: discord.Interaction, page_number: int
-    ) -> None:
         page = await self.source.get_page(page_number)
         self.current_page = page_number
         kwargs = await self._get_kwargs_from_page(page)
-        self._update_labels(page_number)
-        if kwargs:
-            if interaction.response.is_done():
-                if self.message:
-                    await self.message.edit(**kwargs, view=self)
-            else:
-                await interaction.response.edit_message(**kwargs, view=self)
+        if self.cache_pages:
+            kwargs = _copy_kwargs(kwargs)
+            self._rendered[page_number] = kwargs
+            if len(self._rendered) > RENDERED_PAGES:
+                self._rendered.popitem(last=False)
+        return kwargs
+
+    async def show_page(
+        self, interaction: discord.Interaction, page_number: int
+    ) -> None:
+        if page_number == self.requested_page or self._editing:
+            if page_number != self.requested_page:
+                # the edit in progress shows the newest page once it's done
+                self._queued_page = page_number
+            if not interaction.response.is_done():
+                await interaction.response.defer()
+            return
+
+        self._editing = True
+        try:
+            next_page: Optional[int] = page_number
+            while next_page is not None:
+                kwargs = await self._render(next_page)
+                self._update_labels(next_page)
+                if kwargs:
+                    if interaction.response.is_done():
+                        if self.message:
+                            await self.message.edit(**kwargs, view=self)
+                    else:
+                        await interaction.response.edit_message(**kwargs, view=self)
+                next_page, self._queued_page = self._queued_page, None
+        finally:
+            self._editing = False
+            self._queued_page = None
 
     def _update_labels(self, page_number: int) -> None:
         self.go_to_first_page.disabled = page_number == 0
@@ -179,8 +261,7 @@ class RoboPages(discord.ui.View):
             return
 
         await self.source._prepare_once()
-        page = await self.source.get_page(0)
-        kwargs = await self._get_kwargs_from_page(page)
+        kwargs = dict(await self._render(0))
         if content:
             kwargs.setdefault("content", content)
 
@@ -205,8 +286,7 @@ class RoboPages(discord.ui.View):
             return
 
         await self.source._prepare_once()
-        page = await self.source.get_page(0)
-        kwargs = await self._get_kwargs_from_page(page)
+        kwargs = dict(await self._render(0))
         if content:
             kwargs.setdefault("content", content)
 
@@ -226,7 +306,7 @@ class RoboPages(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """go to the previous page"""
-        await self.show_checked_page(interaction, self.current_page - 1)
+        await self.show_checked_page(interaction, self.requested_page - 1)
 
     @discord.ui.button(label="Current", style=discord.ButtonStyle.grey, disabled=True)
     async def go_to_current_page(
@@ -239,7 +319,7 @@ class RoboPages(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """go to the next page"""
-        await self.show_checked_page(interaction, self.current_page + 1)
+        await self.show_checked_page(interaction, self.requested_page + 1)
 
     @discord.ui.button(label="≫", style=discord.ButtonStyle.grey)
     async def go_to_last_page(
@@ -288,7 +368,8 @@ class RoboPages(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """stops the pagination session."""
-        await interaction.response.defer()
+        if not interaction.response.is_done():
+            await interaction.response.defer()
         await interaction.delete_original_response()
         self.stop()
 
@@ -361,6 +442,473 @@ class SimplePageSource(menus.ListPageSource):
         return menu.embed
 
 
+class CursorPageSource(menus.PageSource):
+    """A page source that fetches pages of a collection as they are shown.
+
+    Pages are found with range queries on ``key``, using ``_id`` as a
+    tiebreaker, instead of skipping documents, so a deep page costs as much as
+    the first one. Only the boundaries of pages seen so far and the last
+    ``cache_size`` pages are kept in memory, and the page after the one shown
+    is fetched in the background. Every document must have ``key`` set and the
+    document must not have a converter.
+
+    Subclasses implement :meth:`format_page`, which gets the list of documents
+    on the page.
+    """
+
+    def __init__(
+        self,
+        document: Document,
+        filter: Dict[str, Any],
+        *,
+        key: str,
+        direction: int = alaric.Ascending,
+        per_page: int = 10,
+        cache_size: int = 5,
+        prefetch: bool = True,
+    ) -> None:
+        self.document: Document = document
+        self.filter: Dict[str, Any] = filter
+        self.key: str = key
+        self.direction: int = direction
+        self.per_page: int = per_page
+        self.cache_size: int = cache_size
+        self.prefetch: bool = prefetch
+        self.total: int = 0
+        # (key, _id) of the last and first document of pages found so far
+        self._bounds: Dict[int, Tuple[Any, Any]] = {}
+        self._starts: Dict[int, Tuple[Any, Any]] = {}
+        self._pages: OrderedDict[int, List[Dict[str, Any]]] = OrderedDict()
+        self._pending: Dict[int, asyncio.Task[List[Dict[str, Any]]]] = {}
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def prepare(self) -> None:
+        self.total = await self.document.count(self.filter)
+
+    def is_paginating(self) -> bool:
+        return self.total > self.per_page
+
+    def get_max_pages(self) -> int:
+        pages, left_over = divmod(self.total, self.per_page)
+        if left_over:
+            pages += 1
+        return pages
+
+    def page_bounds(
+        self, page_number: int
+    ) -> Tuple[Optional[Tuple[Any, Any]], Optional[Tuple[Any, Any]]]:
+        """Returns the ``(key, _id)`` of the first and last document of a fetched page."""
+        return self._starts.get(page_number), self._bounds.get(page_number)
+
+    def resume(
+        self,
+        page_number: int,
+        *,
+        after: Optional[Tuple[Any, Any]] = None,
+        before: Optional[Tuple[Any, Any]] = None,
+    ) -> None:
+        """Tells where a page is so it can be fetched without the pages before it.
+
+        ``after`` is the last ``(key, _id)`` of the page before it and
+        ``before`` the first of the page after it, as from :meth:`page_bounds`.
+        """
+        if after is not None and page_number:
+            self._bounds[page_number - 1] = after
+        if before is not None:
+            self._starts[page_number + 1] = before
+
+    def _bound(self, record: Dict[str, Any]) -> Tuple[Any, Any]:
+        value: Any = record
+        for part in self.key.split("."):
+            value = value[part]
+        return value, record["_id"]
+
+    def _cursor(
+        self,
+        limit: int,
+        bound: Optional[Tuple[Any, Any]] = None,
+        *,
+        reverse: bool = False,
+    ) -> Cursor:
+        # documents after bound, or before it when going in reverse
+        direction = -self.direction if reverse else self.direction
+        query = self.filter
+        if bound is not None:
+            value, _id = bound
+            op = "$gt" if direction == alaric.Ascending else "$lt"
+            after = {
+                "$or": [{self.key: {op: value}}, {self.key: value, "_id": {op: _id}}]
+            }
+            query = {"$and": [self.filter, after]} if self.filter else after
+
+        return (
+            self.document.create_cursor()
+            .set_filter(query)
+            .set_sort([(self.key, direction), ("_id", direction)])
+            .set_limit(limit)
+        )
+
+    async def _find_bounds(self, page_number: int) -> None:
+        # jumping ahead only needs the keys of the pages in between
+        known = max((p for p in self._bounds if p < page_number), default=None)
+        first = 0 if known is None else known + 1
+        bound = None if known is None else self._bounds[known]
+        cursor = self._cursor((page_number - first) * self.per_page, bound)
+        records = await cursor.set_projections({self.key: 1}).execute()
+        ends = range(self.per_page - 1, len(records), self.per_page)
+        for offset, index in enumerate(ends):
+            self._bounds[first + offset] = self._bound(records[index])
+
+        if page_number - 1 not in self._bounds:
+            raise IndexError(page_number)
+
+    async def _fetch(self, page_number: int) -> List[Dict[str, Any]]:
+        async with self._lock:
+            if page_number == 0:
+                entries = await self._cursor(self.per_page).execute()
+            elif (
+                page_number - 1 not in self._bounds and page_number + 1 in self._starts
+            ):
+                cursor = self._cursor(
+                    self.per_page, self._starts[page_number + 1], reverse=True
+                )
+                entries = (await cursor.execute())[::-1]
+            elif (
+                page_number - 1 not in self._bounds
+                and page_number == self.get_max_pages() - 1
+            ):
+                # the last page is the tail of the collection
+                limit = self.total - page_number * self.per_page
+                entries = (await self._cursor(limit, reverse=True).execute())[::-1]
+            else:
+                if page_number - 1 not in self._bounds:
+                    await self._find_bounds(page_number)
+                cursor = self._cursor(self.per_page, self._bounds[page_number - 1])
+                entries = await cursor.execute()
+
+            if not entries:
+                if page_number:
+                    raise IndexError(page_number)
+                return entries
+
+            self._starts[page_number] = self._bound(entries[0])
+            self._bounds[page_number] = self._bound(entries[-1])
+            return entries
+
+    def _store(self, page_number: int, entries: List[Dict[str, Any]]) -> None:
+        self._pages[page_number] = entries
+        self._pages.move_to_end(page_number)
+        while len(self._pages) > self.cache_size:
+            self._pages.popitem(last=False)
+
+    def _prefetched(self, page_number: int, task: asyncio.Task) -> None:
+        self._pending.pop(page_number, None)
+        if not task.cancelled() and task.exception() is None:
+            self._store(page_number, task.result())
+
+    def _schedule(self, page_number: int) -> None:
+        if (
+            page_number in self._pages
+            or page_number in self._pending
+            or page_number >= self.get_max_pages()
+        ):
+            return
+
+        task = asyncio.create_task(self._fetch(page_number))
+        task.add_done_callback(lambda t: self._prefetched(page_number, t))
+        self._pending[page_number] = task
+
+    async def get_page(self, page_number: int) -> List[Dict[str, Any]]:
+        entries = self._pages.get(page_number)
+        if entries is None:
+            pending = self._pending.get(page_number)
+            if pending is not None:
+                entries = await asyncio.shield(pending)
+            else:
+                entries = await self._fetch(page_number)
+        self._store(page_number, entries)
+
+        if self.prefetch:
+            self._schedule(page_number + 1)
+        return entries
+
+
+# kind -> page source class, built as cls(bot, owner_id)
+_persistent_sources: Dict[str, Callable[[Any, int], menus.PageSource]] = {}
+
+# action -> label and style, the same buttons as a compact RoboPages
+PAGE_ACTIONS: Dict[str, Tuple[str, discord.ButtonStyle]] = {
+    "first": ("≪", discord.ButtonStyle.grey),
+    "prev": ("Back", discord.ButtonStyle.blurple),
+    "next": ("Next", discord.ButtonStyle.blurple),
+    "last": ("≫", discord.ButtonStyle.grey),
+    "quit": ("Quit", discord.ButtonStyle.red),
+}
+
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _encode_value(value: Any) -> Optional[str]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return f"i{value}"
+    if isinstance(value, datetime.datetime):
+        # BSON dates are UTC milliseconds, naive ones come back from the driver
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return f"d{(value - _EPOCH) // datetime.timedelta(milliseconds=1)}"
+    if isinstance(value, ObjectId):
+        return f"o{value}"
+    return None
+
+
+def _decode_value(token: str) -> Any:
+    tag, value = token[0], token[1:]
+    if tag == "i":
+        return int(value)
+    if tag == "d":
+        return _EPOCH + datetime.timedelta(milliseconds=int(value))
+    return ObjectId(value)
+
+
+def encode_bound(bound: Optional[Tuple[Any, Any]]) -> Optional[str]:
+    """Encodes a ``(key, _id)`` page boundary for a custom ID.
+
+    Only ints, datetimes and object IDs are supported, anything else gives ``None``.
+    """
+    if bound is None:
+        return None
+    tokens = [_encode_value(value) for value in bound]
+    if None in tokens:
+        return None
+    return ".".join(tokens)  # type: ignore
+
+
+def decode_bound(encoded: str) -> Tuple[Any, Any]:
+    key, _id = encoded.split(".")
+    return _decode_value(key), _decode_value(_id)
+
+
+def persistent_page_source(kind: str) -> Callable[[Type[Any]], Type[Any]]:
+    """Registers a page source class for :class:`PersistentPages` under ``kind``.
+
+    The class is built again as ``cls(bot, owner_id)`` for every button press.
+    """
+
+    def decorator(cls: Type[Any]) -> Type[Any]:
+        cls.persistent_kind = kind
+        _persistent_sources[kind] = cls
+        return cls
+
+    return decorator
+
+
+class PageButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=(
+        r"pages:(?P<kind>[a-z_]+):(?P<owner_id>[0-9]+):(?P<action>[a-z]+):(?P<page>[0-9]+)"
+        r"(?::(?P<bound>[dio][-0-9a-f]+\.[dio][-0-9a-f]+))?"
+    ),
+):
+    """A :class:`PersistentPages` button, its custom ID holds the page it goes to.
+
+    Back and Next also hold the boundary of the page shown, the first or last
+    ``(key, _id)`` of a :class:`CursorPageSource`, so the page they go to is a
+    single range query.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        owner_id: int,
+        action: str,
+        page: int,
+        *,
+        bound: Optional[str] = None,
+        disabled: bool = False,
+    ) -> None:
+        label, style = PAGE_ACTIONS[action]
+        custom_id = f"pages:{kind}:{owner_id}:{action}:{page}"
+        if bound is not None and len(custom_id) + len(bound) < 100:
+            custom_id = f"{custom_id}:{bound}"
+        else:
+            bound = None
+
+        super().__init__(
+            discord.ui.Button(
+                label=label, style=style, disabled=disabled, custom_id=custom_id
+            )
+        )
+        self.kind: str = kind
+        self.owner_id: int = owner_id
+        self.action: str = action
+        self.page: int = page
+        self.bound: Optional[str] = bound
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: discord.ui.Button,
+        match: re.Match[str],
+        /,
+    ) -> Self:
+        return cls(
+            match["kind"],
+            int(match["owner_id"]),
+            match["action"],
+            int(match["page"]),
+            bound=match["bound"],
+        )
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id == self.owner_id:
+            return True
+        await respond(
+            interaction,
+            "This pagination menu cannot be controlled by you, sorry!",
+            ephemeral=True,
+        )
+        return False
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        if self.action == "quit":
+            if not interaction.response.is_done():
+                await interaction.response.defer()
+            await interaction.delete_original_response()
+            return
+
+        factory = _persistent_sources.get(self.kind)
+        if factory is None:
+            await respond(
+                interaction,
+                "This pagination menu is no longer available, sorry!",
+                ephemeral=True,
+            )
+            return
+
+        pages = PersistentPages(
+            factory(interaction.client, self.owner_id), owner_id=self.owner_id
+        )
+        bound = decode_bound(self.bound) if self.bound is not None else None
+        if self.action == "prev":
+            kwargs = await pages.render(self.page, before=bound)
+        else:
+            kwargs = await pages.render(self.page, after=bound)
+        # the interaction watchdog defers slow renders as a message update
+        if interaction.response.is_done():
+            await interaction.edit_original_response(**kwargs)
+        else:
+            await interaction.response.edit_message(**kwargs)
+
+
+class PersistentPages:
+    """A paginator that keeps nothing in memory while it is shown.
+
+    Every :class:`PageButton` press builds the source registered with
+    :func:`persistent_page_source` again and renders the one page it asks for,
+    so the buttons keep working across restarts. A :class:`CursorPageSource`
+    resumes from the boundary the button carries instead of walking the
+    pages before it. The source's :meth:`format_page` gets this object as
+    the menu.
+    """
+
+    def __init__(
+        self,
+        source: menus.PageSource,
+        *,
+        owner_id: int,
+        check_embeds: bool = True,
+    ) -> None:
+        self.source: menus.PageSource = source
+        self.kind: str = source.persistent_kind  # type: ignore
+        self.owner_id: int = owner_id
+        self.check_embeds: bool = check_embeds
+        self.current_page: int = 0
+        if isinstance(source, CursorPageSource):
+            # the source is dropped after rendering a single page
+            source.prefetch = False
+
+    def _button(
+        self,
+        action: str,
+        page: int,
+        disabled: bool,
+        bound: Optional[Tuple[Any, Any]] = None,
+    ) -> PageButton:
+        return PageButton(
+            self.kind,
+            self.owner_id,
+            action,
+            page,
+            bound=encode_bound(bound),
+            disabled=disabled,
+        )
+
+    def _view(self) -> Optional[discord.ui.View]:
+        if not self.source.is_paginating():
+            return None
+
+        page = self.current_page
+        max_pages = self.source.get_max_pages()
+        use_last_and_first = max_pages is not None and max_pages >= 2
+        at_end = max_pages is not None and page + 1 >= max_pages
+
+        first = last = None
+        if isinstance(self.source, CursorPageSource):
+            first, last = self.source.page_bounds(page)
+
+        view = discord.ui.View(timeout=None)
+        if use_last_and_first:
+            view.add_item(self._button("first", 0, page == 0))
+        view.add_item(self._button("prev", max(page - 1, 0), page == 0, first))
+        view.add_item(self._button("next", page + 1, at_end, last))
+        if use_last_and_first:
+            view.add_item(self._button("last", max_pages - 1, at_end))  # type: ignore
+        view.add_item(self._button("quit", page, False))
+        # every item is dynamic, a stopped view isn't stored after sending
+        view.stop()
+        return view
+
+    async def render(
+        self,
+        page_number: int,
+        *,
+        after: Optional[Tuple[Any, Any]] = None,
+        before: Optional[Tuple[Any, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Returns the message kwargs for a page, including the view.
+
+        ``after`` and ``before`` are passed to :meth:`CursorPageSource.resume`.
+        """
+        await self.source._prepare_once()
+        max_pages = self.source.get_max_pages()
+        if max_pages and page_number >= max_pages:
+            # entries have gone away since the button was sent
+            page_number = max_pages - 1
+        elif isinstance(self.source, CursorPageSource):
+            self.source.resume(page_number, after=after, before=before)
+
+        self.current_page = page_number
+        page = await self.source.get_page(page_number)
+        value = await discord.utils.maybe_coroutine(self.source.format_page, self, page)
+        kwargs = _page_kwargs(value)
+        kwargs["view"] = self._view()
+        return kwargs
+
+    async def start(self, ctx: Context, *, ephemeral: bool = False) -> None:
+        if self.check_embeds and not ctx.channel.permissions_for(ctx.me).embed_links:  # type: ignore
+            await ctx.send(
+                "Bot does not have embed links permission in this channel.",
+                ephemeral=True,
+            )
+            return
+
+        await ctx.send(**await self.render(0), ephemeral=ephemeral)
+
+
 class SimplePages(RoboPages):
     """A simple pagination session reminiscent of the old Pages interface.
 
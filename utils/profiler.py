@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import List, Optional, Tuple
+
+__all__ = [
+    "SamplingProfile",
+    "sample_thread",
+    "sample_loop",
+    "profile_calls",
+    "memory_diff",
+]
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return (
+        f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    )
+
+
+class SamplingProfile:
+    """Stack samples of a single thread taken at a fixed interval."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval: float = interval
+        self.samples: Counter[Tuple[str, ...]] = Counter()
+        self.total: int = 0
+
+    def add(self, frame: Optional[FrameType]) -> None:
+        stack = []
+        while frame is not None:
+            stack.append(_frame_name(frame))
+            frame = frame.f_back
+        stack.reverse()
+        self.samples[tuple(stack)] += 1
+        self.total += 1
+
+    def collapsed(self) -> str:
+        """Renders the samples in the collapsed stack format used by flamegraph tools."""
+        return "\n".join(
+            f"{';'.join(stack)} {count}" for stack, count in self.samples.most_common()
+        )
+
+    def top(self, limit: int = 15) -> List[Tuple[str, int, int]]:
+        """Returns ``(function, self samples, total samples)`` sorted by self samples."""
+        own: Counter[str] = Counter()
+        inclusive: Counter[str] = Counter()
+        for stack, count in self.samples.items():
+            if stack:
+                own[stack[-1]] += count
+            for name in set(stack):
+                inclusive[name] += count
+        return [
+            (name, count, inclusive[name]) for name, count in own.most_common(limit)
+        ]
+
+
+def sample_thread(
+    thread_id: int, seconds: float, *, interval: float = 0.005
+) -> SamplingProfile:
+    """Samples the stack of another thread, blocks for ``seconds``.
+
+    Meant to be run in an executor while the sampled thread, usually the
+    event loop's, keeps running.
+    """
+    profile = SamplingProfile(interval)
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        profile.add(sys._current_frames().get(thread_id))
+        time.sleep(interval)
+    return profile
+
+
+async def sample_loop(seconds: float, *, interval: float = 0.005) -> SamplingProfile:
+    """Samples the running event loop's thread for ``seconds``."""
+    thread_id = threading.get_ident()
+    return await asyncio.to_thread(sample_thread, thread_id, seconds, interval=interval)
+
+
+async def profile_calls(seconds: float, *, limit: int = 25) -> str:
+    """Runs :mod:`cProfile` over everything the event loop does for ``seconds``."""
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.disable()
+
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    return output.getvalue()
+
+
+async def memory_diff(seconds: float, *, limit: int = 15) -> str:
+    """Returns the allocation growth by line over ``seconds``.
+
+    Tracing is only left enabled if it already was before the call.
+    """
+    import tracemalloc
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(10)
+    try:
+        before = tracemalloc.take_snapshot()
+        await asyncio.sleep(seconds)
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    filters = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    )
+    stats = after.filter_traces(filters).compare_to(
+        before.filter_traces(filters), "lineno"
+    )
+    return "\n".join(str(stat) for stat in stats[:limit])
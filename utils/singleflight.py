@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+import discord
+
+T = TypeVar("T")
+
+__all__ = ["SingleFlight"]
+
+
+class SingleFlight:
+    """Coalesces concurrent lookups for the same key into one request.
+
+    Every caller waiting on a key shares the result of the first caller's
+    request. Lookups that come back empty (``None`` or :exc:`discord.NotFound`)
+    are remembered for ``negative_ttl`` seconds so bursts of lookups for
+    something that does not exist don't each hit the API.
+    """
+
+    def __init__(self, *, negative_ttl: float = 30.0, max_negative: int = 4096):
+        self.negative_ttl: float = negative_ttl
+        self.max_negative: int = max_negative
+        self.coalesced: int = 0
+        self._inflight: Dict[Hashable, asyncio.Task[Any]] = {}
+        # key -> expiry, oldest first as every key gets the same ttl
+        self._missing: OrderedDict[Hashable, float] = OrderedDict()
+
+    @property
+    def negative_size(self) -> int:
+        return len(self._missing)
+
+    def is_missing(self, key: Hashable) -> bool:
+        expires = self._missing.get(key)
+        if expires is None:
+            return False
+        if expires <= time.monotonic():
+            del self._missing[key]
+            return False
+        return True
+
+    def mark_missing(self, key: Hashable) -> None:
+        now = time.monotonic()
+        missing = self._missing
+        missing[key] = now + self.negative_ttl
+        missing.move_to_end(key)
+        while missing:
+            expires = next(iter(missing.values()))
+            if expires > now and len(missing) <= self.max_negative:
+                break
+            missing.popitem(last=False)
+
+    def forget(self, key: Hashable) -> None:
+        self._missing.pop(key, None)
+
+    async def _run(
+        self, key: Hashable, factory: Callable[[], Awaitable[Optional[T]]]
+    ) -> Optional[T]:
+        try:
+            result = await factory()
+        except discord.NotFound:
+            result = None
+        finally:
+            self._inflight.pop(key, None)
+
+        if result is None:
+            self.mark_missing(key)
+        return result
+
+    async def do(
+        self, key: Hashable, factory: Callable[[], Awaitable[Optional[T]]]
+    ) -> Optional[T]:
+        """Returns the result of ``factory``, sharing it with concurrent callers.
+
+        Any other exception raised by the factory is propagated to every
+        caller and is not remembered.
+        """
+        if self.is_missing(key):
+            return None
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(key, factory))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+
+        # a cancelled waiter should not cancel the request for everyone else
+        return await asyncio.shield(task)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import TYPE_CHECKING, Awaitable, Dict, Iterable, Iterator, List, Mapping
+
+if TYPE_CHECKING:
+    from bot import UniversityBot
+
+log = logging.getLogger(__name__)
+
+__all__ = ["StartupTimer", "load_extensions"]
+
+
+class StartupTimer:
+    """Records how long each phase of startup took."""
+
+    def __init__(self) -> None:
+        self.started: float = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    async def run(self, name: str, coro: Awaitable[None]) -> None:
+        with self.phase(name):
+            await coro
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def report(self) -> str:
+        return ", ".join(
+            f"{name} {duration:.2f}s"
+            for name, duration in sorted(
+                self.phases.items(), key=lambda p: p[1], reverse=True
+            )
+        )
+
+
+async def load_extensions(
+    bot: UniversityBot,
+    extensions: Iterable[str],
+    *,
+    dependencies: Mapping[str, Iterable[str]],
+    timer: StartupTimer,
+) -> List[str]:
+    """Loads extensions concurrently, each one after the ones it depends on.
+
+    An extension whose dependency failed to load is skipped. Returns the
+    extensions that loaded.
+    """
+    extensions = list(extensions)
+    tasks: Dict[str, asyncio.Task[bool]] = {}
+
+    async def load(extension: str) -> bool:
+        for dependency in dependencies.get(extension, ()):
+            task = tasks.get(dependency)
+            if task is not None and not await task:
+                log.warning(
+                    "Skipping extension %s, its dependency %s failed to load.",
+                    extension,
+                    dependency,
+                )
+                return False
+
+        try:
+            with timer.phase(extension):
+                await bot.load_extension(extension)
+        except Exception:
+            log.exception("Failed to load extension %s.", extension)
+            return False
+        log.info("Loaded extension %s.", extension)
+        return True
+
+    for extension in extensions:
+        tasks[extension] = asyncio.create_task(load(extension))
+
+    results = await asyncio.gather(*tasks.values())
+    return [ext for ext, loaded in zip(extensions, results) if loaded]
@@ -1,28 +1,45 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import functools
 import re
-from typing import TYPE_CHECKING, Any, Optional, Union
+import threading
+import zoneinfo
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-import parsedatetime as pdt
-from dateutil.relativedelta import relativedelta
 from discord import app_commands
 from discord.ext import commands
 
 from .formats import format_dt as format_dt
 from .formats import human_join, plural
 
-# Monkey patch mins and secs into the units
-units = pdt.pdtLocales["en_US"].units
-units["minutes"].append("mins")
-units["seconds"].append("secs")
-
 if TYPE_CHECKING:
+    import parsedatetime as pdt
+    from dateutil.relativedelta import relativedelta
     from typing_extensions import Self
 
     from .context import Context
 
 __all__ = [
+    "Duration",
+    "scan_duration",
+    "scan_timestamp",
     "ShortTime",
     "RelativeDelta",
     "HumanTime",
@@ -33,26 +50,420 @@ __all__ = [
     "FriendlyTimeResult",
     "UserFriendlyTime",
     "human_timedelta",
+    "human_timedeltas",
     "format_relative",
+    "get_calendar",
+    "run_nlp",
+    "ParseCache",
+    "parse_cache",
+    "parse_blocking",
+    "parse_natural",
+    "find_timezone",
+    "search_timezones",
+    "TimeZone",
 ]
 
+T = TypeVar("T")
+
+# Natural language parsing is CPU bound and its cost grows with the input,
+# so it runs on a small thread pool with a deadline instead of the event loop.
+NLP_TIMEOUT = 2.0
+NLP_WORKERS = 2
+# Longest input handed to parsedatetime, for a time on its own and for a
+# time followed or preceded by the reminder text
+MAX_TIME_LENGTH = 100
+MAX_NLP_LENGTH = 1500
+
+_local = threading.local()
+_locale_lock = threading.Lock()
+_locale_patched: bool = False
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_calendar() -> pdt.Calendar:
+    """Returns the parsedatetime calendar of the current thread.
+
+    Calendars keep parsing state on themselves so every thread gets its own.
+    parsedatetime is only imported the first time natural language has to be
+    parsed, which keeps it out of the bot's startup.
+    """
+    calendar = getattr(_local, "calendar", None)
+    if calendar is None:
+        import parsedatetime as pdt
+
+        global _locale_patched
+        with _locale_lock:
+            if not _locale_patched:
+                # Monkey patch mins and secs into the units
+                units = pdt.pdtLocales["en_US"].units
+                units["minutes"].append("mins")
+                units["seconds"].append("secs")
+                _locale_patched = True
+        calendar = _local.calendar = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+    return calendar
+
+
+async def run_nlp(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs a natural language parsing function off the event loop.
+
+    Raises :exc:`commands.BadArgument` if it does not finish within
+    ``NLP_TIMEOUT`` seconds. The worker can't be interrupted, it finishes in
+    the background, but with a bounded pool a flood of slow inputs only
+    delays other time parsing rather than the whole bot.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(NLP_WORKERS, thread_name_prefix="time-nlp")
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+    try:
+        return await asyncio.wait_for(future, timeout=NLP_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise commands.BadArgument(
+            'That took too long to understand, try e.g. "tomorrow" or "3 days".'
+        ) from None
+
+
+class Parsed(NamedTuple):
+    """A parsedatetime result, ``dt`` is naive and in the wall clock of ``now``."""
 
-class ShortTime:
-    compiled = re.compile(
+    dt: datetime.datetime
+    status: Any
+    begin: int
+    end: int
+
+
+# how far back the second parse of a miss is anchored to tell relative
+# expressions ("in 2 hours") apart from anchored ones ("tomorrow at 9am"),
+# it shifts the date as well so date-only phrases can't pass as relative
+_PROBE = datetime.timedelta(days=1, hours=1, minutes=1, seconds=1)
+
+
+def _wall_clock(now: datetime.datetime) -> datetime.datetime:
+    # parsedatetime works on the time tuple, so it drops the timezone and microseconds
+    return now.replace(microsecond=0, tzinfo=None)
+
+
+class _Entry:
+    __slots__ = ("parsed", "delta", "day", "expires", "wall_time")
+
+    def __init__(
+        self,
+        parsed: Optional[Parsed],
+        delta: Optional[datetime.timedelta] = None,
+        day: Optional[datetime.date] = None,
+        expires: Optional[datetime.datetime] = None,
+        wall_time: bool = False,
+    ) -> None:
+        self.parsed: Optional[Parsed] = parsed
+        self.delta: Optional[datetime.timedelta] = delta
+        self.day: Optional[datetime.date] = day
+        self.expires: Optional[datetime.datetime] = expires
+        # date-only parses take the time of day from ``now``
+        self.wall_time: bool = wall_time
+
+
+class ParseCache:
+    """An LRU cache of natural language parses that are re-resolved against each ``now``.
+
+    A date-only parse ("friday", "in 3 days") keeps the time of day of
+    ``now``, its date is reused for the rest of the day. Anything else is
+    parsed again against a probe a day and an hour earlier. If the result
+    moved by exactly the probe and has a time the expression is relative and
+    its offset is stored. If its time of day didn't move it is anchored and
+    its result is reused until the end of the day, or until the time itself
+    if that comes first. Anything else is not cached. Inputs that fail to
+    parse are cached as such.
+    """
+
+    def __init__(self, maxsize: int = 2048) -> None:
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        # parses are stored from the NLP worker threads
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def key(kind: str, argument: str, now: datetime.datetime) -> Hashable:
+        if kind == "dt":
+            # offsets into the argument don't matter for a full parse
+            argument = " ".join(argument.lower().split())
+        return (kind, argument, now.tzinfo)
+
+    def get(
+        self, key: Hashable, now: datetime.datetime
+    ) -> Tuple[bool, Optional[Parsed]]:
+        """Returns whether ``key`` was cached and its parse resolved against ``now``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                resolved = self._resolve(entry, _wall_clock(now))
+                if resolved is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, resolved[0]
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    @staticmethod
+    def _resolve(
+        entry: _Entry, wall: datetime.datetime
+    ) -> Optional[Tuple[Optional[Parsed]]]:
+        parsed = entry.parsed
+        if parsed is None:
+            return (None,)
+        if entry.delta is not None:
+            return (parsed._replace(dt=wall + entry.delta),)
+        if wall.date() != entry.day:
+            return None
+        if entry.wall_time:
+            dt = datetime.datetime.combine(parsed.dt.date(), wall.time())
+            return (parsed._replace(dt=dt),)
+        if wall < entry.expires:  # type: ignore
+            return (parsed,)
+        return None
+
+    def put(
+        self,
+        key: Hashable,
+        now: datetime.datetime,
+        parsed: Optional[Parsed],
+        parse: Callable[[datetime.datetime], Optional[Parsed]],
+    ) -> None:
+        """Stores a parse made against ``now``.
+
+        ``parse`` parses the same input again, it is only called when the
+        result alone doesn't tell how it moves with ``now``.
         """
-           (?:(?P<years>[0-9])(?:years?|y))?                    # e.g. 2y
-           (?:(?P<months>[0-9]{1,2})(?:months?|mon?))?          # e.g. 2months
-           (?:(?P<weeks>[0-9]{1,4})(?:weeks?|w))?               # e.g. 10w
-           (?:(?P<days>[0-9]{1,5})(?:days?|d))?                 # e.g. 14d
-           (?:(?P<hours>[0-9]{1,5})(?:hours?|hr?))?             # e.g. 12h
-           (?:(?P<minutes>[0-9]{1,5})(?:minutes?|m(?:in)?))?    # e.g. 10m
-           (?:(?P<seconds>[0-9]{1,5})(?:seconds?|s(?:ec)?))?    # e.g. 15s
-        """,
-        re.VERBOSE,
+        wall = _wall_clock(now)
+        if parsed is None:
+            entry = _Entry(None)
+        elif not parsed.status.hasTime and parsed.dt.time() == wall.time():
+            entry = _Entry(parsed, day=wall.date(), wall_time=True)
+        else:
+            probed = parse(now - _PROBE)
+            if probed is None or parsed[1:] != probed[1:]:
+                return
+            if parsed.status.hasTime and parsed.dt - probed.dt == _PROBE:
+                entry = _Entry(parsed, delta=parsed.dt - wall)
+            elif parsed.dt.time() == probed.dt.time():
+                midnight = datetime.datetime.combine(
+                    wall.date() + datetime.timedelta(days=1), datetime.time()
+                )
+                expires = min(midnight, parsed.dt) if parsed.dt > wall else midnight
+                entry = _Entry(parsed, day=wall.date(), expires=expires)
+            else:
+                return
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+parse_cache = ParseCache()
+
+
+def _parse_dt(argument: str, now: datetime.datetime) -> Optional[Parsed]:
+    dt, status = get_calendar().parseDT(argument, sourceTime=now, tzinfo=None)
+    if not status.hasDateOrTime:
+        return None
+    return Parsed(dt, status, 0, len(argument))
+
+
+def _nlp(argument: str, now: datetime.datetime) -> Optional[Parsed]:
+    elements = get_calendar().nlp(argument, sourceTime=now)
+    if not elements:
+        return None
+    dt, status, begin, end, _ = elements[0]
+    return Parsed(dt, status, begin, end)
+
+
+_PARSERS = {"dt": _parse_dt, "nlp": _nlp}
+
+
+def _parse_and_store(
+    kind: str, argument: str, now: datetime.datetime, key: Hashable
+) -> Optional[Parsed]:
+    func = _PARSERS[kind]
+    parsed = func(argument, now)
+    parse_cache.put(key, now, parsed, functools.partial(func, argument))
+    return parsed
+
+
+def parse_blocking(
+    kind: str, argument: str, now: datetime.datetime
+) -> Optional[Parsed]:
+    """Parses with ``parseDT`` (``dt``) or ``nlp`` (``nlp``) through :data:`parse_cache`.
+
+    This blocks on a miss, use :func:`parse_natural` from the event loop.
+    """
+    key = parse_cache.key(kind, argument, now)
+    found, parsed = parse_cache.get(key, now)
+    if found:
+        return parsed
+    return _parse_and_store(kind, argument, now, key)
+
+
+async def parse_natural(
+    kind: str, argument: str, now: datetime.datetime
+) -> Optional[Parsed]:
+    """Like :func:`parse_blocking` but misses are parsed off the event loop."""
+    key = parse_cache.key(kind, argument, now)
+    found, parsed = parse_cache.get(key, now)
+    if found:
+        return parsed
+    return await run_nlp(_parse_and_store, kind, argument, now, key)
+
+
+# (unit, most digits, spellings longest first) in the order they must appear
+_UNITS: Tuple[Tuple[str, int, Tuple[str, ...]], ...] = (
+    ("years", 1, ("years", "year", "y")),
+    ("months", 2, ("months", "month", "mon", "mo")),
+    ("weeks", 4, ("weeks", "week", "w")),
+    ("days", 5, ("days", "day", "d")),
+    ("hours", 5, ("hours", "hour", "hr", "h")),
+    ("minutes", 5, ("minutes", "minute", "min", "m")),
+    ("seconds", 5, ("seconds", "second", "sec", "s")),
+)
+# spelling -> (unit index, most digits)
+_SPELLINGS: Dict[str, Tuple[int, int]] = {
+    spelling: (index, max_digits)
+    for index, (_, max_digits, spellings) in enumerate(_UNITS)
+    for spelling in spellings
+}
+# a number and the letters right after it
+_TOKEN = re.compile(r"([0-9]+)([a-z]*)")
+_TIMESTAMP = re.compile(r"<t:([0-9]+)(?::?[RFfDdTt])?>")
+
+
+class Duration:
+    """A compact duration such as ``2d4h30m`` read by :func:`scan_duration`.
+
+    ``end`` is the index in the scanned string right after the duration.
+    """
+
+    __slots__ = (
+        "years",
+        "months",
+        "weeks",
+        "days",
+        "hours",
+        "minutes",
+        "seconds",
+        "end",
     )
 
-    discord_fmt = re.compile(r"<t:(?P<ts>[0-9]+)(?:\:?[RFfDdTt])?>")
+    def __init__(self) -> None:
+        self.years: int = 0
+        self.months: int = 0
+        self.weeks: int = 0
+        self.days: int = 0
+        self.hours: int = 0
+        self.minutes: int = 0
+        self.seconds: int = 0
+        self.end: int = 0
+
+    def relativedelta(self) -> relativedelta:
+        from dateutil.relativedelta import relativedelta
+
+        return relativedelta(
+            years=self.years,
+            months=self.months,
+            weeks=self.weeks,
+            days=self.days,
+            hours=self.hours,
+            minutes=self.minutes,
+            seconds=self.seconds,
+        )
+
+    def add_to(self, dt: datetime.datetime) -> datetime.datetime:
+        # only years and months need calendar arithmetic
+        if self.years or self.months:
+            return dt + self.relativedelta()
+        return dt + datetime.timedelta(
+            self.weeks * 7 + self.days,
+            self.hours * 3600 + self.minutes * 60 + self.seconds,
+        )
+
+
+def _match_unit(letters: str, digits: int, unit: int) -> Optional[Tuple[int, int]]:
+    """Returns the unit index and length of the spelling ``letters`` starts with."""
+    exact = _SPELLINGS.get(letters)
+    if exact is not None and exact[0] >= unit and digits <= exact[1]:
+        return exact[0], len(letters)
+
+    # e.g. "5mins", only "5min" belongs to the duration
+    for index in range(unit, len(_UNITS)):
+        _, max_digits, spellings = _UNITS[index]
+        if digits > max_digits:
+            continue
+        for spelling in spellings:
+            if letters.startswith(spelling):
+                return index, len(spelling)
+    return None
+
+
+def scan_duration(argument: str, start: int = 0) -> Optional[Duration]:
+    """Reads a compact duration like ``2d4h30m`` from ``argument[start:]``.
+
+    Units have to be in descending order, without spaces, each at most once.
+    Scanning stops at the first thing that doesn't continue the duration.
+    Returns ``None`` if nothing was read.
+    """
+    duration = None
+    pos = start
+    unit = 0
+    while unit < len(_UNITS):
+        token = _TOKEN.match(argument, pos)
+        if token is None:
+            break
+        number, letters = token.groups()
+        matched = _match_unit(letters, len(number), unit)
+        if matched is None:
+            break
+
+        if duration is None:
+            duration = Duration()
+        index, length = matched
+        setattr(duration, _UNITS[index][0], int(number))
+        pos = token.start(2) + length
+        unit = index + 1
+
+    if duration is not None:
+        duration.end = pos
+    return duration
+
+
+def scan_timestamp(argument: str, start: int = 0) -> Optional[Tuple[int, int]]:
+    """Reads a Discord timestamp like ``<t:1700000000:R>`` from ``argument[start:]``.
+
+    Returns the unix timestamp and the index right after it.
+    """
+    match = _TIMESTAMP.match(argument, start)
+    if match is None:
+        return None
+    return int(match.group(1)), match.end()
+
 
+class ShortTime:
     dt: datetime.datetime
 
     def __init__(
@@ -62,12 +473,12 @@ class ShortTime:
         now: Optional[datetime.datetime] = None,
         tzinfo: datetime.tzinfo = datetime.timezone.utc,
     ):
-        match = self.compiled.fullmatch(argument)
-        if match is None or not match.group(0):
-            match = self.discord_fmt.fullmatch(argument)
-            if match is not None:
+        duration = scan_duration(argument)
+        if duration is None or duration.end != len(argument):
+            stamp = scan_timestamp(argument)
+            if stamp is not None and stamp[1] == len(argument):
                 self.dt = datetime.datetime.fromtimestamp(
-                    int(match.group("ts")), tz=datetime.timezone.utc
+                    stamp[0], tz=datetime.timezone.utc
                 )
                 if tzinfo is not datetime.timezone.utc:
                     self.dt = self.dt.astimezone(tzinfo)
@@ -75,30 +486,27 @@ class ShortTime:
             else:
                 raise commands.BadArgument("invalid time provided")
 
-        data = {k: int(v) for k, v in match.groupdict(default=0).items()}
         now = now or datetime.datetime.now(datetime.timezone.utc)
-        self.dt = now + relativedelta(**data)
+        self.dt = duration.add_to(now)
         if tzinfo is not datetime.timezone.utc:
             self.dt = self.dt.astimezone(tzinfo)
 
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> Self:
         tzinfo = datetime.timezone.utc
-        # reminder = ctx.bot.reminder
-        # if reminder is not None:
-        #     tzinfo = await reminder.get_tzinfo(ctx.author.id)
+        reminder = ctx.bot.reminder
+        if reminder is not None:
+            tzinfo = await reminder.get_tzinfo(ctx.author.id)
         return cls(argument, now=ctx.message.created_at, tzinfo=tzinfo)
 
 
 class RelativeDelta(app_commands.Transformer, commands.Converter):
     @classmethod
     def __do_conversion(cls, argument: str) -> relativedelta:
-        match = ShortTime.compiled.fullmatch(argument)
-        if match is None or not match.group(0):
+        duration = scan_duration(argument)
+        if duration is None or duration.end != len(argument):
             raise ValueError("invalid time provided")
-
-        data = {k: int(v) for k, v in match.groupdict(default=0).items()}
-        return relativedelta(**data)
+        return duration.relativedelta()
 
     async def convert(self, ctx: Context, argument: str) -> relativedelta:
         try:
@@ -114,8 +522,6 @@ class RelativeDelta(app_commands.Transformer, commands.Converter):
 
 
 class HumanTime:
-    calendar = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
-
     def __init__(
         self,
         argument: str,
@@ -123,13 +529,23 @@ class HumanTime:
         now: Optional[datetime.datetime] = None,
         tzinfo: datetime.tzinfo = datetime.timezone.utc,
     ):
-        now = now or datetime.datetime.now(tzinfo)
-        dt, status = self.calendar.parseDT(argument, sourceTime=now, tzinfo=None)
-        if not status.hasDateOrTime:
+        # parse in the wall clock of the timezone
+        now = now.astimezone(tzinfo) if now else datetime.datetime.now(tzinfo)
+        self._from_parsed(parse_blocking("dt", argument, now), now, tzinfo)
+
+    def _from_parsed(
+        self,
+        parsed: Optional[Parsed],
+        now: datetime.datetime,
+        tzinfo: datetime.tzinfo,
+    ) -> None:
+        if parsed is None:
             raise commands.BadArgument(
                 'invalid time provided, try e.g. "tomorrow" or "3 days"'
             )
 
+        dt, status = parsed.dt, parsed.status
+
         if not status.hasTime:
             # replace it with the current time
             dt = dt.replace(
@@ -144,13 +560,32 @@ class HumanTime:
             now = now.replace(tzinfo=datetime.timezone.utc)
         self._past: bool = self.dt < now
 
+    @classmethod
+    async def parse(
+        cls,
+        argument: str,
+        *,
+        now: Optional[datetime.datetime] = None,
+        tzinfo: datetime.tzinfo = datetime.timezone.utc,
+    ) -> Self:
+        """Constructs the time with natural language parsed off the event loop."""
+        if len(argument) > MAX_TIME_LENGTH:
+            raise commands.BadArgument("That time is too long.")
+
+        now = now.astimezone(tzinfo) if now else datetime.datetime.now(tzinfo)
+        parsed = await parse_natural("dt", argument, now)
+        # skip __init__, it would look the parse up again
+        self = cls.__new__(cls)
+        self._from_parsed(parsed, now, tzinfo)
+        return self
+
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> Self:
         tzinfo = datetime.timezone.utc
-        # reminder = ctx.bot.reminder
-        # if reminder is not None:
-        #     tzinfo = await reminder.get_tzinfo(ctx.author.id)
-        return cls(argument, now=ctx.message.created_at, tzinfo=tzinfo)
+        reminder = ctx.bot.reminder
+        if reminder is not None:
+            tzinfo = await reminder.get_tzinfo(ctx.author.id)
+        return await cls.parse(argument, now=ctx.message.created_at, tzinfo=tzinfo)
 
 
 class Time(HumanTime):
@@ -169,6 +604,25 @@ class Time(HumanTime):
             self.dt = o.dt
             self._past = False
 
+    @classmethod
+    async def parse(
+        cls,
+        argument: str,
+        *,
+        now: Optional[datetime.datetime] = None,
+        tzinfo: datetime.tzinfo = datetime.timezone.utc,
+    ) -> Self:
+        # short times are cheap to parse, keep them on the event loop
+        try:
+            short = ShortTime(argument, now=now, tzinfo=tzinfo)
+        except commands.BadArgument:
+            return await super().parse(argument, now=now, tzinfo=tzinfo)
+        # skip __init__, it would scan the argument again
+        self = cls.__new__(cls)
+        self.dt = short.dt
+        self._past = False
+        return self
+
 
 class FutureTime(Time):
     def __init__(
@@ -183,6 +637,19 @@ class FutureTime(Time):
         if self._past:
             raise commands.BadArgument("this time is in the past")
 
+    @classmethod
+    async def parse(
+        cls,
+        argument: str,
+        *,
+        now: Optional[datetime.datetime] = None,
+        tzinfo: datetime.tzinfo = datetime.timezone.utc,
+    ) -> Self:
+        self = await super().parse(argument, now=now, tzinfo=tzinfo)
+        if self._past:
+            raise commands.BadArgument("this time is in the past")
+        return self
+
 
 class BadTimeTransform(app_commands.AppCommandError):
     pass
@@ -191,22 +658,17 @@ class BadTimeTransform(app_commands.AppCommandError):
 class TimeTransformer(app_commands.Transformer):
     async def transform(self, interaction, value: str) -> datetime.datetime:
         tzinfo = datetime.timezone.utc
-        # reminder = interaction.client.get_cog('Reminder')
-        # if reminder is not None:
-        #     tzinfo = await reminder.get_tzinfo(interaction.user.id)
+        reminder = interaction.client.get_cog("Reminder")
+        if reminder is not None:
+            tzinfo = await reminder.get_tzinfo(interaction.user.id)
 
         now = interaction.created_at
         try:
-            short = ShortTime(value, now=now, tzinfo=tzinfo)
-        except commands.BadArgument:
-            try:
-                human = FutureTime(value, now=now, tzinfo=tzinfo)
-            except commands.BadArgument as e:
-                raise BadTimeTransform(str(e)) from None
-            else:
-                return human.dt
-        else:
-            return short.dt
+            # tries ShortTime before natural language
+            human = await FutureTime.parse(value, now=now, tzinfo=tzinfo)
+        except commands.BadArgument as e:
+            raise BadTimeTransform(str(e)) from None
+        return human.dt
 
 
 class FriendlyTimeResult:
@@ -259,35 +721,30 @@ class UserFriendlyTime(commands.Converter):
         self.default: Any = default
 
     async def convert(self, ctx: Context, argument: str) -> FriendlyTimeResult:
-        calendar = HumanTime.calendar
-        regex = ShortTime.compiled
         now = ctx.message.created_at
 
-        # reminder = ctx.bot.reminder
+        reminder = ctx.bot.reminder
         tzinfo = datetime.timezone.utc
-        # if reminder is not None:
-        #     tzinfo = await reminder.get_tzinfo(ctx.author.id)
-
-        match = regex.match(argument)
-        if match is not None and match.group(0):
-            data = {k: int(v) for k, v in match.groupdict(default=0).items()}
-            remaining = argument[match.end() :].strip()
-            dt = now + relativedelta(**data)
-            result = FriendlyTimeResult(dt.astimezone(tzinfo))
+        if reminder is not None:
+            tzinfo = await reminder.get_tzinfo(ctx.author.id)
+
+        duration = scan_duration(argument)
+        if duration is not None:
+            remaining = argument[duration.end :].strip()
+            result = FriendlyTimeResult(duration.add_to(now).astimezone(tzinfo))
             await result.ensure_constraints(ctx, self, now, remaining)
             return result
 
-        if match is None or not match.group(0):
-            match = ShortTime.discord_fmt.match(argument)
-            if match is not None:
-                result = FriendlyTimeResult(
-                    datetime.datetime.fromtimestamp(
-                        int(match.group("ts")), tz=datetime.timezone.utc
-                    ).astimezone(tzinfo)
-                )
-                remaining = argument[match.end() :].strip()
-                await result.ensure_constraints(ctx, self, now, remaining)
-                return result
+        stamp = scan_timestamp(argument)
+        if stamp is not None:
+            result = FriendlyTimeResult(
+                datetime.datetime.fromtimestamp(
+                    stamp[0], tz=datetime.timezone.utc
+                ).astimezone(tzinfo)
+            )
+            remaining = argument[stamp[1] :].strip()
+            await result.ensure_constraints(ctx, self, now, remaining)
+            return result
 
         # apparently nlp does not like "from now"
         # it likes "from x" in other cases though so let me handle the 'now' case
@@ -299,10 +756,13 @@ class UserFriendlyTime(commands.Converter):
             if argument[0:6] in ("me to ", "me in ", "me at "):
                 argument = argument[6:]
 
+        if len(argument) > MAX_NLP_LENGTH:
+            raise commands.BadArgument("That reminder is too long.")
+
         # Have to adjust the timezone so pdt knows how to handle things like "tomorrow at 6pm" in an aware way
         now = now.astimezone(tzinfo)
-        elements = calendar.nlp(argument, sourceTime=now)
-        if elements is None or len(elements) == 0:
+        parsed = await parse_natural("nlp", argument, now)
+        if parsed is None:
             raise commands.BadArgument(
                 'Invalid time provided, try e.g. "tomorrow" or "3 days".'
             )
@@ -313,7 +773,7 @@ class UserFriendlyTime(commands.Converter):
         # foo date time
 
         # first the first two cases:
-        dt, status, begin, end, dt_string = elements[0]
+        dt, status, begin, end = parsed
 
         if not status.hasDateOrTime:
             raise commands.BadArgument(
@@ -336,8 +796,10 @@ class UserFriendlyTime(commands.Converter):
                 microsecond=now.microsecond,
             )
 
+        from parsedatetime import pdtContext
+
         # if midnight is provided, just default to next day
-        if status.accuracy == pdt.pdtContext.ACU_HALFDAY:
+        if status.accuracy == pdtContext.ACU_HALFDAY:
             dt = dt.replace(day=now.day + 1)
 
         result = FriendlyTimeResult(dt.replace(tzinfo=tzinfo))
@@ -364,36 +826,45 @@ class UserFriendlyTime(commands.Converter):
         return result
 
 
-def human_timedelta(
-    dt: datetime.datetime,
-    *,
-    source: Optional[datetime.datetime] = None,
-    accuracy: Optional[int] = 3,
-    brief: bool = False,
-    suffix: bool = True,
-) -> str:
-    now = source or datetime.datetime.now(datetime.timezone.utc)
+# spans shorter than this never have a month or year component
+_CALENDAR_FREE = datetime.timedelta(days=28)
+_FAST_UNITS = (
+    (604800, "week", "w"),
+    (86400, "day", "d"),
+    (3600, "hour", "h"),
+    (60, "minute", "m"),
+    (1, "second", "s"),
+)
+
+
+def _utc_aware(dt: datetime.datetime) -> datetime.datetime:
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=datetime.timezone.utc)
+        return dt.replace(tzinfo=datetime.timezone.utc)
+    return dt
 
-    if now.tzinfo is None:
-        now = now.replace(tzinfo=datetime.timezone.utc)
 
-    # Microsecond free zone
-    now = now.replace(microsecond=0)
-    dt = dt.replace(microsecond=0)
+def _fast_parts(seconds: int, brief: bool) -> List[str]:
+    output = []
+    for size, name, brief_name in _FAST_UNITS:
+        if seconds < size:
+            continue
+        count, seconds = divmod(seconds, size)
+        if brief:
+            output.append(f"{count}{brief_name}")
+        elif count == 1:
+            output.append(f"1 {name}")
+        else:
+            output.append(f"{count} {name}s")
+    return output
 
-    # This implementation uses relativedelta instead of the much more obvious
-    # divmod approach with seconds because the seconds approach is not entirely
-    # accurate once you go over 1 week in terms of accuracy since you have to
-    # hardcode a month as 30 or 31 days.
-    # A query like "11 months" can be interpreted as "!1 months and 6 days"
-    if dt > now:
-        delta = relativedelta(dt, now)
-        output_suffix = ""
-    else:
-        delta = relativedelta(now, dt)
-        output_suffix = " ago" if suffix else ""
+
+def _calendar_parts(
+    dt: datetime.datetime, now: datetime.datetime, brief: bool
+) -> List[str]:
+    from dateutil.relativedelta import relativedelta
+
+    # Microsecond free zone
+    delta = relativedelta(dt.replace(microsecond=0), now.replace(microsecond=0))
 
     attrs = [
         ("year", "y"),
@@ -426,18 +897,124 @@ def human_timedelta(
             output.append(f"{elem}{brief_attr}")
         else:
             output.append(format(plural(elem), attr))
+    return output
+
+
+def _human_timedelta(
+    dt: datetime.datetime,
+    now: datetime.datetime,
+    accuracy: Optional[int],
+    brief: bool,
+    suffix: bool,
+) -> str:
+    dt = _utc_aware(dt)
+    if dt.tzinfo is not now.tzinfo:
+        # months are counted on the wall clock of the source
+        dt = dt.astimezone(now.tzinfo)
+    if dt > now:
+        later, earlier = dt, now
+        output_suffix = ""
+    else:
+        later, earlier = now, dt
+        output_suffix = " ago" if suffix else ""
+
+    # This implementation uses relativedelta instead of the much more obvious
+    # divmod approach with seconds because the seconds approach is not entirely
+    # accurate once you go over 1 week in terms of accuracy since you have to
+    # hardcode a month as 30 or 31 days.
+    # A query like "11 months" can be interpreted as "!1 months and 6 days"
+    # Spans under 4 weeks can't contain a month, so those do use divmod.
+    delta = later - earlier
+    if delta < _CALENDAR_FREE:
+        # the same as dropping the microseconds of both ends first
+        micros = delta.microseconds - later.microsecond + earlier.microsecond
+        seconds = delta.days * 86400 + delta.seconds + micros // 1_000_000
+        output = _fast_parts(seconds, brief)
+    else:
+        output = _calendar_parts(later, earlier, brief)
 
     if accuracy is not None:
         output = output[:accuracy]
 
     if len(output) == 0:
         return "now"
-    else:
-        if not brief:
-            return human_join(output, final="and") + output_suffix
-        else:
-            return " ".join(output) + output_suffix
+    if brief:
+        return " ".join(output) + output_suffix
+    return human_join(output, final="and") + output_suffix
+
+
+def human_timedelta(
+    dt: datetime.datetime,
+    *,
+    source: Optional[datetime.datetime] = None,
+    accuracy: Optional[int] = 3,
+    brief: bool = False,
+    suffix: bool = True,
+) -> str:
+    now = _utc_aware(source or datetime.datetime.now(datetime.timezone.utc))
+    return _human_timedelta(dt, now, accuracy, brief, suffix)
+
+
+def human_timedeltas(
+    dts: Iterable[datetime.datetime],
+    *,
+    source: Optional[datetime.datetime] = None,
+    accuracy: Optional[int] = 3,
+    brief: bool = False,
+    suffix: bool = True,
+) -> List[str]:
+    """Renders many datetimes like :func:`human_timedelta` against one ``source``."""
+    now = _utc_aware(source or datetime.datetime.now(datetime.timezone.utc))
+    return [_human_timedelta(dt, now, accuracy, brief, suffix) for dt in dts]
 
 
 def format_relative(dt: datetime.datetime) -> str:
     return format_dt(dt, "R")
+
+
+_timezones: Optional[Tuple[List[str], Dict[str, str]]] = None
+
+
+def _timezone_names() -> Tuple[List[str], Dict[str, str]]:
+    global _timezones
+    if _timezones is None:
+        names = sorted(zoneinfo.available_timezones())
+        _timezones = (names, {name.casefold(): name for name in names})
+    return _timezones
+
+
+def find_timezone(argument: str) -> Optional[str]:
+    """Returns the IANA name matching ``argument`` ignoring case, e.g. ``Europe/London``."""
+    _, folded = _timezone_names()
+    return folded.get(argument.strip().replace(" ", "_").casefold())
+
+
+def search_timezones(query: str, *, limit: int = 25) -> List[str]:
+    """Returns timezone names containing ``query``, those starting with it first."""
+    names, _ = _timezone_names()
+    query = query.strip().replace(" ", "_").casefold()
+    if not query:
+        return names[:limit]
+
+    starts, contains = [], []
+    for name in names:
+        folded = name.casefold()
+        if folded.startswith(query):
+            starts.append(name)
+            if len(starts) >= limit:
+                break
+        elif query in folded:
+            contains.append(name)
+    return (starts + contains)[:limit]
+
+
+class TimeZone(commands.Converter):
+    """Converts to an IANA timezone name."""
+
+    async def convert(self, ctx: Context, argument: str) -> str:
+        name = find_timezone(argument)
+        if name is None:
+            raise commands.BadArgument(
+                f"Could not find a timezone named {argument!r}, try e.g. Europe/London."
+            )
+        return name